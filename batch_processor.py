@@ -5,22 +5,31 @@ Handles multiple jobs in parallel with resource management
 """
 
 import asyncio
+from array import array
 import concurrent.futures
+import heapq
+import itertools
+import random
+import sys
 import threading
 import time
 import json
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 import logging
-from dataclasses import dataclass
-from queue import Queue, Empty
+from dataclasses import dataclass, field
+from collections import deque
+from queue import Empty, Full
 import traceback
 
 from linkedin_agent import LinkedInSourcingAgent
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Slotted job records (no per-instance __dict__) where dataclasses support it
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class JobRequest:
     """Job request data structure"""
     job_id: str
@@ -30,13 +39,9 @@ class JobRequest:
     location: Optional[str] = None
     max_candidates: int = 20
     priority: int = 1  # Higher number = higher priority
-    created_at: Optional[datetime] = None
-    
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class JobResult:
     """Job result data structure"""
     job_id: str
@@ -45,38 +50,261 @@ class JobResult:
     error: Optional[str] = None
     processing_time: float = 0.0
     candidates_found: int = 0
-    completed_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = field(default_factory=datetime.now)
+
+class LockFreeQueue:
+    """
+    FIFO queue without a mutex on the non-blocking put/get path.
+    deque.append and deque.popleft are atomic in CPython, so producers and
+    consumers never serialize on a lock. Callers that have to block wait on
+    a condition variable, which state changes only touch while someone is
+    waiting on it. maxsize is a soft bound (concurrent producers may
+    overshoot it by a few items).
+    """
+    
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._items = deque()
+        # One token per unfinished item; len() is the outstanding count
+        self._unfinished = deque()
+        self._changed = threading.Condition()
+        self._waiters = 0
+    
+    def _wait(self, ready: Callable[[], bool], timeout: Optional[float]) -> bool:
+        """
+        Return as soon as ready() is true, blocking on the condition until
+        it is or the timeout expires
+        """
+        if ready():
+            return True
+        with self._changed:
+            # Registered before ready() is re-checked under the lock, so a
+            # change made after that check always sees a waiter to notify
+            self._waiters += 1
+            try:
+                return self._changed.wait_for(ready, timeout)
+            finally:
+                self._waiters -= 1
+    
+    def _notify(self):
+        """
+        Wake blocked callers after a state change; free when none are waiting
+        """
+        if self._waiters:
+            with self._changed:
+                self._changed.notify_all()
+    
+    def put(self, item: Any, timeout: Optional[float] = None):
+        if self.maxsize > 0 and len(self._items) >= self.maxsize:
+            if not self._wait(lambda: len(self._items) < self.maxsize, timeout):
+                raise Full
+        self._unfinished.append(None)
+        self._items.append(item)
+        self._notify()
+    
+    def get(self, timeout: Optional[float] = None) -> Any:
+        taken = []
+        
+        def take() -> bool:
+            try:
+                taken.append(self._items.popleft())
+            except IndexError:
+                return False
+            return True
+        
+        if not self._wait(take, timeout):
+            raise Empty
+        self._notify()
+        return taken[0]
+    
+    def steal(self) -> Any:
+        """
+        Take the newest item without blocking (used by idle peer workers,
+        which take from the opposite end to the owner)
+        """
+        try:
+            item = self._items.pop()
+        except IndexError:
+            raise Empty
+        self._notify()
+        return item
+    
+    def task_done(self):
+        try:
+            self._unfinished.pop()
+        except IndexError:
+            raise ValueError('task_done() called too many times')
+        self._notify()
+    
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every item put on the queue has been marked done
+        """
+        return self._wait(lambda: not self._unfinished, timeout)
+    
+    def qsize(self) -> int:
+        return len(self._items)
+    
+    def empty(self) -> bool:
+        return not self._items
+
+class PriorityJobQueue(LockFreeQueue):
+    """
+    Per-worker job queue that hands out the highest-priority job first
+    (ties in submission order). heapq operations are not atomic, so the
+    heap takes a small per-queue lock; task_done/join keep the lock-free
+    token bookkeeping of the base class.
+    """
+    
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._items = []
+        self._heap_lock = threading.Lock()
+        self._sequence = itertools.count()
+    
+    def put(self, item: Any, timeout: Optional[float] = None):
+        if self.maxsize > 0 and len(self._items) >= self.maxsize:
+            if not self._wait(lambda: len(self._items) < self.maxsize, timeout):
+                raise Full
+        entry = (-item.priority, next(self._sequence), item)
+        self._unfinished.append(None)
+        with self._heap_lock:
+            heapq.heappush(self._items, entry)
+        self._notify()
+    
+    def _pop_entry(self) -> Any:
+        with self._heap_lock:
+            if not self._items:
+                raise Empty
+            return heapq.heappop(self._items)[-1]
     
-    def __post_init__(self):
-        if self.completed_at is None:
-            self.completed_at = datetime.now()
+    def get(self, timeout: Optional[float] = None) -> Any:
+        taken = []
+        
+        def take() -> bool:
+            try:
+                taken.append(self._pop_entry())
+            except Empty:
+                return False
+            return True
+        
+        if not self._wait(take, timeout):
+            raise Empty
+        self._notify()
+        return taken[0]
+    
+    def steal(self) -> Any:
+        """
+        Take the highest-priority job without blocking, so urgent work
+        moves to whichever worker is idle
+        """
+        item = self._pop_entry()
+        self._notify()
+        return item
+
+class ResultRing(LockFreeQueue):
+    """
+    Unbounded single-consumer results channel. Producers never wait and
+    there is no task_done bookkeeping, so a push is one deque.append (plus
+    a wakeup when the reader is blocked).
+    """
+    
+    def __init__(self):
+        super().__init__(maxsize=0)
+    
+    def push_nonblocking(self, item: Any):
+        self._items.append(item)
+        self._notify()
+    
+    def put(self, item: Any, timeout: Optional[float] = None):
+        self.push_nonblocking(item)
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = 0) -> List[Any]:
+        """
+        Drain up to max_items results in one call, waiting at most timeout
+        for the first one; returns an empty list if none arrive
+        """
+        if not self._wait(lambda: bool(self._items), timeout):
+            return []
+        batch = []
+        popleft = self._items.popleft
+        while len(batch) < max_items:
+            try:
+                batch.append(popleft())
+            except IndexError:
+                break
+        return batch
+
+class LockFreeStack(LockFreeQueue):
+    """
+    Unbounded LIFO pool of interchangeable resources. push and pop are a
+    single atomic deque.append/deque.pop; the most recently returned (and
+    therefore warmest) item is handed out first.
+    """
+    
+    def __init__(self):
+        super().__init__(maxsize=0)
+    
+    def push(self, item: Any):
+        self._items.append(item)
+        self._notify()
+    
+    def pop(self, timeout: Optional[float] = None) -> Any:
+        taken = []
+        
+        def take() -> bool:
+            try:
+                taken.append(self._items.pop())
+            except IndexError:
+                return False
+            return True
+        
+        if not self._wait(take, timeout):
+            raise Empty
+        return taken[0]
+
+# Per-thread statistics, summed across threads on read: one unsigned array
+# indexed by the constants below (processing time in integer nanoseconds)
+_COUNT_FIELDS = ('jobs_submitted', 'jobs_completed', 'jobs_failed', 'processing_time_ns')
+_SUBMITTED, _COMPLETED, _FAILED, _PROCESSING_NS = range(len(_COUNT_FIELDS))
+
+def _new_counters():
+    return array('Q', [0] * len(_COUNT_FIELDS))
 
 class BatchProcessor:
     """
     Batch processor for handling multiple LinkedIn sourcing jobs
     """
     
+    # How long an idle worker blocks on its own queue before checking its
+    # peers for work to steal and whether it has been stopped; a job put on
+    # its own queue wakes it immediately
+    _IDLE_WAIT = 0.05
+    
     def __init__(self, max_workers: int = 3, max_queue_size: int = 100):
         self.max_workers = max_workers
         self.max_queue_size = max_queue_size
-        self.job_queue = Queue(maxsize=max_queue_size)
-        self.results_queue = Queue()
+        # One priority-ordered job queue per worker; idle workers steal
+        # from their peers
+        per_worker_size = -(-max_queue_size // max_workers)
+        self.job_queues = [PriorityJobQueue(maxsize=per_worker_size) for _ in range(max_workers)]
+        self.results_queue = ResultRing()
         self.workers = []
         self.is_running = False
-        self.stats = {
-            'jobs_submitted': 0,
-            'jobs_completed': 0,
-            'jobs_failed': 0,
-            'total_processing_time': 0.0,
-            'average_processing_time': 0.0
-        }
-        self.lock = threading.Lock()
         
-        # Initialize agents pool
-        self.agents_pool = Queue(maxsize=max_workers)
-        for _ in range(max_workers):
-            agent = LinkedInSourcingAgent()
-            self.agents_pool.put(agent)
+        # Statistics: every thread bumps its own counters (no shared writes);
+        # the registry lets get_stats sum them, and counters of exited
+        # workers are folded into self._final
+        self._tls = threading.local()
+        self._counter_registry = []
+        self._final = _new_counters()
+        self._registry_lock = threading.Lock()
+        
+        # Agents pool, filled lazily: each agent owns a browser session, so
+        # they are only built when a worker first needs one
+        self.agents_pool = LockFreeStack()
+        self._agents_created = 0
+        self._agents_lock = threading.Lock()
     
     def start_workers(self):
         """
@@ -89,10 +317,12 @@ class BatchProcessor:
         self.is_running = True
         logger.info(f"Starting batch processor with {self.max_workers} workers")
         
-        # Start worker threads
+        # Daemon threads, so a caller that never stops the processor does
+        # not keep the interpreter alive at exit
         for i in range(self.max_workers):
             worker = threading.Thread(
                 target=self._worker_loop,
+                args=(i,),
                 name=f"Worker-{i}",
                 daemon=True
             )
@@ -111,88 +341,189 @@ class BatchProcessor:
         logger.info("Stopping batch processor...")
         self.is_running = False
         
-        # Wait for workers to finish
+        # Wait for workers to finish, at most 30 s in total; a worker stuck
+        # in a job is left to finish (or die with the process) on its own
+        deadline = time.monotonic() + 30
         for worker in self.workers:
-            worker.join(timeout=30)
+            worker.join(timeout=max(0.0, deadline - time.monotonic()))
+        self.workers = []
         
         logger.info("Batch processor stopped")
     
-    def _worker_loop(self):
+    def shutdown(self):
+        """
+        Stop workers (same as stop_workers; kept alongside
+        AsyncBatchProcessor.shutdown)
+        """
+        self.stop_workers()
+    
+    def _worker_loop(self, worker_index: int):
         """
         Main worker loop
         """
         worker_name = threading.current_thread().name
+        counters = self._local_counters()
         
-        while self.is_running:
+        try:
+            self._run_worker(worker_index, worker_name, counters)
+        finally:
+            self._retire_local_counters()
+    
+    def _checkout_agent(self) -> LinkedInSourcingAgent:
+        """
+        Take an idle agent, building a new one if fewer than max_workers
+        exist yet
+        """
+        try:
+            return self.agents_pool.pop(timeout=0)
+        except Empty:
+            pass
+        
+        with self._agents_lock:
+            create = self._agents_created < self.max_workers
+            if create:
+                self._agents_created += 1
+        if create:
             try:
-                # Get job from queue with timeout
-                job_request = self.job_queue.get(timeout=1)
-                logger.info(f"{worker_name} processing job {job_request.job_id}")
-                
-                # Get agent from pool
-                agent = self.agents_pool.get(timeout=5)
-                
+                return LinkedInSourcingAgent()
+            except Exception:
+                with self._agents_lock:
+                    self._agents_created -= 1
+                raise
+        return self.agents_pool.pop(timeout=30)
+    
+    def _run_worker(self, worker_index: int, worker_name: str, counters: array):
+        """
+        Pull jobs off the queue until the processor is stopped
+        """
+        # Bind one agent to this worker for the whole run instead of
+        # checking one out of the pool per job. If it can't be built (the
+        # database can't be opened, say), the worker stays up: each job it
+        # takes retries building one and fails with the error if it still
+        # can't, so queued jobs are never left waiting on a dead worker
+        try:
+            agent = self._checkout_agent()
+        except Exception as e:
+            logger.error(f"{worker_name} could not create an agent: {e}")
+            agent = None
+        
+        try:
+            while self.is_running:
                 try:
-                    # Process the job
-                    start_time = time.time()
-                    result = self._process_job(agent, job_request)
-                    processing_time = time.time() - start_time
-                    
-                    # Create job result
-                    job_result = JobResult(
-                        job_id=job_request.job_id,
-                        success=True,
-                        result=result,
-                        processing_time=processing_time,
-                        candidates_found=result.get('candidates_found', 0) if result else 0
+                    # Get job from own queue, or steal one from a peer (only
+                    # with an agent: failing a peer's job helps no one)
+                    job_queue, job_request = self._next_job(
+                        worker_index, self._IDLE_WAIT, steal=agent is not None
                     )
+                    logger.info(f"{worker_name} processing job {job_request.job_id}")
                     
-                    logger.info(f"{worker_name} completed job {job_request.job_id} in {processing_time:.2f}s")
+                    try:
+                        # Process the job
+                        start_ns = time.perf_counter_ns()
+                        if agent is None:
+                            agent = self._checkout_agent()
+                        result = self._process_job(agent, job_request)
+                        processing_ns = time.perf_counter_ns() - start_ns
+                        processing_time = processing_ns / 1e9
+                        
+                        # Create job result
+                        job_result = JobResult(
+                            job_id=job_request.job_id,
+                            success=True,
+                            result=result,
+                            processing_time=processing_time,
+                            candidates_found=result.get('candidates_found', 0) if result else 0
+                        )
+                        
+                        logger.info(f"{worker_name} completed job {job_request.job_id} in {processing_time:.2f}s")
+                        
+                    except Exception as e:
+                        processing_ns = time.perf_counter_ns() - start_ns
+                        processing_time = processing_ns / 1e9
+                        error_msg = f"Error processing job {job_request.job_id}: {str(e)}"
+                        logger.error(error_msg)
+                        
+                        job_result = JobResult(
+                            job_id=job_request.job_id,
+                            success=False,
+                            error=error_msg,
+                            processing_time=processing_time
+                        )
                     
-                except Exception as e:
-                    processing_time = time.time() - start_time
-                    error_msg = f"Error processing job {job_request.job_id}: {str(e)}"
-                    logger.error(error_msg)
+                    # Put result in results queue
+                    self.results_queue.push_nonblocking(job_result)
                     
-                    job_result = JobResult(
-                        job_id=job_request.job_id,
-                        success=False,
-                        error=error_msg,
-                        processing_time=processing_time
-                    )
-                
-                finally:
-                    # Return agent to pool
-                    self.agents_pool.put(agent)
-                
-                # Put result in results queue
-                self.results_queue.put(job_result)
-                
-                # Update statistics
-                with self.lock:
-                    self.stats['jobs_completed'] += 1
-                    self.stats['total_processing_time'] += processing_time
-                    if job_result.success:
-                        self.stats['jobs_completed'] += 1
-                    else:
-                        self.stats['jobs_failed'] += 1
+                    # Update statistics
+                    counters[_PROCESSING_NS] += processing_ns
+                    counters[_COMPLETED if job_result.success else _FAILED] += 1
                     
-                    # Update average processing time
-                    completed = self.stats['jobs_completed'] + self.stats['jobs_failed']
-                    if completed > 0:
-                        self.stats['average_processing_time'] = (
-                            self.stats['total_processing_time'] / completed
-                        )
-                
-                # Mark job as done
-                self.job_queue.task_done()
-                
-            except Empty:
-                # No jobs in queue, continue
+                    # Mark job as done
+                    job_queue.task_done()
+                    
+                except Empty:
+                    # No jobs in queue, look again (peers may have work to steal)
+                    continue
+                except Exception as e:
+                    logger.error(f"{worker_name} encountered error: {e}")
+                    continue
+        finally:
+            if agent is not None:
+                self.agents_pool.push(agent)
+    
+    def _next_job(self, worker_index: int, idle_wait: float, steal: bool = True):
+        """
+        Return (queue, job) from the worker's own queue, falling back to
+        stealing from a random peer; raises Empty if there is no work
+        """
+        own_queue = self.job_queues[worker_index]
+        if not steal:
+            return own_queue, own_queue.get(timeout=idle_wait)
+        try:
+            return own_queue, own_queue.get(timeout=0)
+        except Empty:
+            pass
+        
+        peer_count = len(self.job_queues)
+        start = random.randrange(peer_count)
+        for offset in range(peer_count):
+            victim = self.job_queues[(start + offset) % peer_count]
+            if victim is own_queue:
                 continue
-            except Exception as e:
-                logger.error(f"{worker_name} encountered error: {e}")
+            try:
+                return victim, victim.steal()
+            except Empty:
                 continue
+        
+        return own_queue, own_queue.get(timeout=idle_wait)
+    
+    def _local_counters(self) -> array:
+        """
+        Get the calling thread's counters, registering them on first use
+        """
+        counters = getattr(self._tls, 'counters', None)
+        if counters is None:
+            counters = _new_counters()
+            self._tls.counters = counters
+            with self._registry_lock:
+                self._counter_registry.append(counters)
+        return counters
+    
+    def _retire_local_counters(self):
+        """
+        Fold the calling thread's counters into the final totals
+        """
+        counters = getattr(self._tls, 'counters', None)
+        if counters is None:
+            return
+        with self._registry_lock:
+            self._counter_registry.remove(counters)
+            self._add_counters(self._final, counters)
+        del self._tls.counters
+    
+    @staticmethod
+    def _add_counters(total: array, counters: array):
+        for i, value in enumerate(counters):
+            total[i] += value
     
     def _process_job(self, agent: LinkedInSourcingAgent, job_request: JobRequest) -> Dict:
         """
@@ -211,9 +542,10 @@ class BatchProcessor:
         Submit a job to the processing queue
         """
         try:
-            self.job_queue.put(job_request, timeout=5)
-            with self.lock:
-                self.stats['jobs_submitted'] += 1
+            # Route to the least loaded worker queue
+            job_queue = min(self.job_queues, key=LockFreeQueue.qsize)
+            job_queue.put(job_request, timeout=5)
+            self._local_counters()[_SUBMITTED] += 1
             logger.info(f"Submitted job {job_request.job_id} to queue")
             return True
         except Exception as e:
@@ -233,31 +565,40 @@ class BatchProcessor:
         """
         Get all completed job results
         """
-        results = []
-        while True:
-            result = self.get_result(timeout=0.1)
-            if result is None:
-                break
-            results.append(result)
-        return results
+        return self.results_queue.get_many(sys.maxsize, timeout=0)
     
     def get_stats(self) -> Dict:
         """
         Get batch processor statistics
         """
-        with self.lock:
-            stats = self.stats.copy()
-            stats['queue_size'] = self.job_queue.qsize()
-            stats['results_queue_size'] = self.results_queue.qsize()
-            stats['active_workers'] = len([w for w in self.workers if w.is_alive()])
-            return stats
+        total = _new_counters()
+        with self._registry_lock:
+            self._add_counters(total, self._final)
+            for counters in self._counter_registry:
+                self._add_counters(total, counters)
+        
+        stats = dict(zip(_COUNT_FIELDS[:_PROCESSING_NS], total))
+        stats['total_processing_time'] = total[_PROCESSING_NS] / 1e9
+        
+        finished = stats['jobs_completed'] + stats['jobs_failed']
+        stats.update({
+            'average_processing_time': stats['total_processing_time'] / finished if finished > 0 else 0.0,
+            'queue_size': sum(job_queue.qsize() for job_queue in self.job_queues),
+            'results_queue_size': self.results_queue.qsize(),
+            'active_workers': len([w for w in self.workers if w.is_alive()])
+        })
+        return stats
     
     def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
         """
         Wait for all jobs in queue to complete
         """
         try:
-            self.job_queue.join()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            for job_queue in self.job_queues:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not job_queue.join(remaining):
+                    return False
             return True
         except Exception as e:
             logger.error(f"Error waiting for completion: {e}")
@@ -270,11 +611,18 @@ class AsyncBatchProcessor:
     
     def __init__(self, max_concurrent: int = 3):
         self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
         self.jobs = []
         self.results = []
         self.agents = []
         
+        # Dedicated, long-lived threads for the blocking agent pipeline: one
+        # per concurrent job, reused across process_jobs calls instead of
+        # growing the loop's default executor on demand
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent,
+            thread_name_prefix="AsyncBatch"
+        )
+        
         # Initialize agents
         for _ in range(max_concurrent):
             self.agents.append(LinkedInSourcingAgent())
@@ -283,44 +631,64 @@ class AsyncBatchProcessor:
         """
         Process multiple jobs concurrently
         """
+        self.results = [job_result async for job_result in self.stream_results(job_requests)]
+        
+        logger.info(f"Completed async batch processing. {len(self.results)} results")
+        return self.results
+    
+    async def stream_results(self, job_requests: List[JobRequest]):
+        """
+        Process multiple jobs concurrently, yielding each result as soon as
+        its job finishes
+        """
         self.jobs = job_requests
-        self.results = []
         
         logger.info(f"Starting async batch processing of {len(job_requests)} jobs")
         
-        # Create tasks for all jobs
-        tasks = []
-        for job_request in job_requests:
-            task = asyncio.create_task(self._process_job_async(job_request))
-            tasks.append(task)
-        
-        # Wait for all tasks to complete
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Idle agents; a job holds one exclusively while it runs, which also
+        # caps concurrency at max_concurrent. Built per batch so it belongs
+        # to the running event loop.
+        idle_agents = asyncio.Queue()
+        for agent in self.agents:
+            idle_agents.put_nowait(agent)
         
-        logger.info(f"Completed async batch processing. {len(self.results)} results")
-        return self.results
+        # Feed jobs in as earlier ones finish so at most max_concurrent
+        # tasks exist at once, however long the batch is
+        pending_jobs = iter(job_requests)
+        in_flight = set()
+        try:
+            while True:
+                for job_request in itertools.islice(pending_jobs, self.max_concurrent - len(in_flight)):
+                    in_flight.add(asyncio.ensure_future(self._process_job_async(job_request, idle_agents)))
+                if not in_flight:
+                    break
+                
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
     
-    async def _process_job_async(self, job_request: JobRequest):
+    async def _process_job_async(self, job_request: JobRequest, idle_agents: asyncio.Queue) -> JobResult:
         """
         Process a single job asynchronously
         """
-        async with self.semaphore:
-            start_time = time.time()
+        agent = await idle_agents.get()
+        try:
+            start_ns = time.perf_counter_ns()
             
             try:
-                # Get agent (simple round-robin for now)
-                agent = self.agents[len(self.results) % len(self.agents)]
-                
-                # Process job in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    self._process_job_sync,
-                    agent,
-                    job_request
+                result = await agent.process_job_async(
+                    job_description=job_request.job_description,
+                    company_name=job_request.company_name,
+                    position_title=job_request.position_title,
+                    location=job_request.location,
+                    max_candidates=job_request.max_candidates,
+                    executor=self.executor
                 )
                 
-                processing_time = time.time() - start_time
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
                 job_result = JobResult(
                     job_id=job_request.job_id,
@@ -333,7 +701,7 @@ class AsyncBatchProcessor:
                 logger.info(f"Completed job {job_request.job_id} in {processing_time:.2f}s")
                 
             except Exception as e:
-                processing_time = time.time() - start_time
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e9
                 error_msg = f"Error processing job {job_request.job_id}: {str(e)}"
                 logger.error(error_msg)
                 
@@ -344,19 +712,15 @@ class AsyncBatchProcessor:
                     processing_time=processing_time
                 )
             
-            self.results.append(job_result)
+            return job_result
+        finally:
+            idle_agents.put_nowait(agent)
     
-    def _process_job_sync(self, agent: LinkedInSourcingAgent, job_request: JobRequest) -> Dict:
+    def shutdown(self):
         """
-        Process job synchronously (called from thread pool)
+        Release the worker threads once no more batches will be run
         """
-        return agent.process_job(
-            job_description=job_request.job_description,
-            company_name=job_request.company_name,
-            position_title=job_request.position_title,
-            location=job_request.location,
-            max_candidates=job_request.max_candidates
-        )
+        self.executor.shutdown(wait=True)
 
 def create_sample_jobs() -> List[JobRequest]:
     """
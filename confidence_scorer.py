@@ -5,13 +5,19 @@ Evaluates data quality and completeness for candidate profiles
 """
 
 import re
+import sys
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Slotted metrics (no per-instance __dict__) where dataclasses support it
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ConfidenceMetrics:
     """Confidence metrics for different data sources"""
     linkedin: float = 0.0
@@ -24,11 +30,48 @@ class ConfidenceMetrics:
     data_consistency: float = 0.0
     reliability_score: float = 0.0
 
+class ConfidenceMetricsBatch:
+    """
+    Confidence metrics for many candidates in one (N, 9) array, one column
+    per ConfidenceMetrics field. batch['overall'] gives a column, batch[i]
+    a ConfidenceMetrics for one candidate.
+    """
+    
+    __slots__ = ('data',)
+    COLUMNS = tuple(field.name for field in fields(ConfidenceMetrics))
+    
+    def __init__(self, size: int):
+        self.data = np.zeros((size, len(self.COLUMNS)))
+    
+    def __len__(self) -> int:
+        return len(self.data)
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.data[:, self.COLUMNS.index(key)]
+        return ConfidenceMetrics(*self.data[key].tolist())
+    
+    def __setitem__(self, column: str, values):
+        self.data[:, self.COLUMNS.index(column)] = values
+
 class ConfidenceScorer:
     """
     Comprehensive confidence scoring system
     """
     
+    # (metric, threshold, message): recommend when the metric is below threshold
+    RECOMMENDATION_RULES = tuple(
+        (attrgetter(metric), threshold, message)
+        for metric, threshold, message in (
+            ('overall', 0.7, "Overall confidence is low - consider manual verification"),
+            ('linkedin', 0.8, "LinkedIn profile data is incomplete"),
+            ('github', 0.6, "GitHub profile could provide additional insights"),
+            ('data_completeness', 0.6, "Profile data is incomplete - missing key information"),
+            ('data_freshness', 0.5, "Data may be outdated - consider recent updates"),
+            ('data_consistency', 0.7, "Data consistency issues detected across sources")
+        )
+    )
+    
     def __init__(self):
         # Data quality indicators
         self.quality_indicators = {
@@ -78,157 +121,223 @@ class ConfidenceScorer:
             'twitter': 14,   # Twitter activity within 14 days
             'website': 90    # Website updated within 90 days
         }
+        
+        # Per-source weight vectors, one entry per flag returned by the
+        # matching _*_flags method (same column order)
+        linkedin = self.quality_indicators['linkedin']
+        github = self.quality_indicators['github']
+        twitter = self.quality_indicators['twitter']
+        website = self.quality_indicators['website']
+        self.flag_weights = {
+            'linkedin': (
+                linkedin['profile_complete'], linkedin['has_headline'], linkedin['has_location'],
+                linkedin['has_company'], linkedin['has_skills'], linkedin['has_education'],
+                linkedin['has_experience']
+            ),
+            'github': (
+                github['profile_exists'], github['has_bio'], github['has_location'],
+                github['has_company'], github['has_repos'], github['has_activity'],
+                github['recent_commits'], github['stars_received']
+            ),
+            # Twitter API access is limited, so the bio only gets half credit
+            'twitter': (twitter['profile_exists'], twitter['has_bio'] * 0.5),
+            'website': (
+                website['site_accessible'], website['has_contact_info'], website['has_skills_section'],
+                website['has_portfolio'], website['has_about_section']
+            )
+        }
+        # Website professionalism checks: one case-insensitive scan per field
+        # instead of lowercasing and testing each keyword separately
+        self.professional_pattern = re.compile(r'portfolio|resume|cv|developer|engineer', re.IGNORECASE)
+        self.about_pattern = re.compile(r'about', re.IGNORECASE)
+        
+        # Reciprocal of each source's indicator count, used to normalize
+        # scores to 0-1 without a len() and division per candidate
+        self.flag_norms = {
+            source: 1.0 / len(indicators)
+            for source, indicators in self.quality_indicators.items()
+        }
+        self.flag_extractors = {
+            'linkedin': self._linkedin_flags,
+            'github': self._github_flags,
+            'twitter': self._twitter_flags,
+            'website': self._website_flags
+        }
     
     def calculate_comprehensive_confidence(self, candidate: Dict) -> ConfidenceMetrics:
         """
         Calculate comprehensive confidence metrics for a candidate
         """
         metrics = ConfidenceMetrics()
+        prepared = self._prepare(candidate)
         
         # Calculate source-specific confidence
-        metrics.linkedin = self._calculate_linkedin_confidence(candidate)
-        metrics.github = self._calculate_github_confidence(candidate)
-        metrics.twitter = self._calculate_twitter_confidence(candidate)
-        metrics.website = self._calculate_website_confidence(candidate)
+        metrics.linkedin = self._score_flags('linkedin', self._linkedin_flags(candidate))
+        metrics.github = self._score_flags('github', self._github_flags(candidate, prepared))
+        metrics.twitter = self._score_flags('twitter', self._twitter_flags(candidate))
+        metrics.website = self._score_flags('website', self._website_flags(candidate))
         
         # Calculate overall metrics
         metrics.overall = self._calculate_overall_confidence(metrics)
         metrics.data_completeness = self._calculate_data_completeness(candidate)
-        metrics.data_freshness = self._calculate_data_freshness(candidate)
-        metrics.data_consistency = self._calculate_data_consistency(candidate)
+        metrics.data_freshness = self._calculate_data_freshness(candidate, prepared)
+        metrics.data_consistency = self._calculate_data_consistency(candidate, prepared)
         metrics.reliability_score = self._calculate_reliability_score(metrics)
         
         return metrics
     
-    def _calculate_linkedin_confidence(self, candidate: Dict) -> float:
+    def _prepare(self, candidate: Dict) -> Dict:
         """
-        Calculate LinkedIn profile confidence
+        Resolve the values several checks share once per scoring pass:
+        lowercased comparable text fields and the recent GitHub repo count.
+        Kept separate from the candidate dict, which is later written out as
+        JSON.
+        """
+        github_profile = candidate.get('github_profile', {})
+        github_repos = candidate.get('github_repos', [])
+        return {
+            'github_repo_count': len(github_repos),
+            'recent_repo_count': self._count_recent([repo.get('updated_at', '') for repo in github_repos], 30),
+            'name': candidate.get('name', '').lower(),
+            'location': candidate.get('location', '').lower(),
+            'github_name': github_profile.get('name', '').lower(),
+            'github_location': github_profile.get('location', '').lower(),
+            'linkedin_skills': frozenset(skill.lower() for skill in candidate.get('skills', [])),
+            'github_skills': frozenset(skill.lower() for skill in candidate.get('github_skills', [])),
+            'website_skills': frozenset(skill.lower() for skill in candidate.get('personal_website', {}).get('skills_found', []))
+        }
+    
+    def calculate_batch(self, candidates: List[Dict]) -> ConfidenceMetricsBatch:
+        """
+        Calculate confidence metrics for many candidates at once: one
+        boolean flag matrix per source (rows=candidates), scored with a
+        single matrix-vector product; the combined scores are computed
+        column-wise over the whole batch.
+        """
+        scores = ConfidenceMetricsBatch(len(candidates))
+        prepared = [self._prepare(candidate) for candidate in candidates]
+        for source, extract_flags in self.flag_extractors.items():
+            weights = np.array(self.flag_weights[source])
+            flags = np.array([extract_flags(candidate, view) for candidate, view in zip(candidates, prepared)], dtype=bool)
+            flags = flags.reshape(len(candidates), len(weights))
+            confidence = flags.astype(float) @ weights
+            scores[source] = np.minimum(1.0, confidence * self.flag_norms[source])
+        
+        sources = np.column_stack([scores[source] for source in self.flag_extractors])
+        scores['overall'] = np.minimum(1.0, sources @ np.array([0.5, 0.3, 0.1, 0.1]))
+        
+        scores['data_completeness'] = [self._calculate_data_completeness(candidate) for candidate in candidates]
+        scores['data_freshness'] = [self._calculate_data_freshness(c, view) for c, view in zip(candidates, prepared)]
+        scores['data_consistency'] = [self._calculate_data_consistency(c, view) for c, view in zip(candidates, prepared)]
+        
+        quality = np.column_stack([
+            scores['overall'], scores['data_completeness'], scores['data_freshness'], scores['data_consistency']
+        ])
+        scores['reliability_score'] = np.minimum(1.0, quality @ np.array([0.4, 0.3, 0.2, 0.1]))
+        return scores
+    
+    def _score_flags(self, source: str, flags: List[bool]) -> float:
+        """
+        Weighted sum of one candidate's flags for a source, normalized to 0-1
         """
         confidence = 0.0
-        indicators = self.quality_indicators['linkedin']
-        
-        # Basic profile completeness
-        if candidate.get('name'):
-            confidence += indicators['profile_complete']
-        
-        if candidate.get('headline'):
-            confidence += indicators['has_headline']
-        
-        if candidate.get('location'):
-            confidence += indicators['has_location']
-        
-        if candidate.get('current_company'):
-            confidence += indicators['has_company']
-        
-        # Skills and experience
-        skills = candidate.get('skills', [])
-        if skills and len(skills) > 0:
-            confidence += indicators['has_skills']
+        for weight, present in zip(self.flag_weights[source], flags):
+            if present:
+                confidence += weight
+        score = confidence * self.flag_norms[source]
+        return score if score < 1.0 else 1.0
+    
+    def _linkedin_flags(self, candidate: Dict, prepared: Optional[Dict] = None) -> List[bool]:
+        """
+        LinkedIn indicators present on the candidate
+        """
+        return [
+            bool(candidate.get('name')),
+            bool(candidate.get('headline')),
+            bool(candidate.get('location')),
+            bool(candidate.get('current_company')),
+            bool(candidate.get('skills')),
+            bool(candidate.get('education')),
+            bool(candidate.get('experience'))
+        ]
+    
+    def _github_flags(self, candidate: Dict, prepared: Optional[Dict] = None) -> List[bool]:
+        """
+        GitHub indicators present on the candidate
+        """
+        github_profile = candidate.get('github_profile', {})
+        github_repos = candidate.get('github_repos', [])
+        if prepared is None:
+            recent_repo_count = self._count_recent([repo.get('updated_at', '') for repo in github_repos], 30)
+        else:
+            recent_repo_count = prepared['recent_repo_count']
+        
+        has_profile = bool(github_profile)
+        return [
+            has_profile,
+            has_profile and bool(github_profile.get('bio')),
+            has_profile and bool(github_profile.get('location')),
+            has_profile and bool(github_profile.get('company')),
+            has_profile and github_profile.get('public_repos', 0) > 0,
+            has_profile and github_profile.get('followers', 0) > 0,
+            # Repository analysis: recent activity and stars
+            recent_repo_count > 0,
+            sum(repo.get('stars', 0) for repo in github_repos) > 0
+        ]
+    
+    def _twitter_flags(self, candidate: Dict, prepared: Optional[Dict] = None) -> List[bool]:
+        """
+        Twitter indicators present on the candidate
+        """
+        # Note: In a real implementation, you'd check for bio, location, etc.
+        has_profile = bool(candidate.get('twitter_profile', {}))
+        return [has_profile, has_profile]
+    
+    def _website_flags(self, candidate: Dict, prepared: Optional[Dict] = None) -> List[bool]:
+        """
+        Personal website indicators present on the candidate
+        """
+        personal_website = candidate.get('personal_website', {})
+        if not personal_website:
+            return [False] * 5
         
-        education = candidate.get('education', [])
-        if education and len(education) > 0:
-            confidence += indicators['has_education']
+        contact_info = personal_website.get('contact_info', {})
         
-        experience = candidate.get('experience', [])
-        if experience and len(experience) > 0:
-            confidence += indicators['has_experience']
+        # Check for professional indicators
+        title = personal_website.get('title', '')
+        description = personal_website.get('description', '')
         
-        # Normalize to 0-1 range
-        return min(1.0, confidence / len(indicators))
+        return [
+            True,
+            bool(contact_info.get('email') or contact_info.get('phone')),
+            bool(personal_website.get('skills_found', [])),
+            bool(self.professional_pattern.search(title) or self.professional_pattern.search(description)),
+            bool(self.about_pattern.search(title) or self.about_pattern.search(description))
+        ]
+    
+    def _calculate_linkedin_confidence(self, candidate: Dict) -> float:
+        """
+        Calculate LinkedIn profile confidence
+        """
+        return self._score_flags('linkedin', self._linkedin_flags(candidate))
     
     def _calculate_github_confidence(self, candidate: Dict) -> float:
         """
         Calculate GitHub profile confidence
         """
-        confidence = 0.0
-        indicators = self.quality_indicators['github']
-        
-        github_profile = candidate.get('github_profile', {})
-        github_repos = candidate.get('github_repos', [])
-        
-        if github_profile:
-            confidence += indicators['profile_exists']
-            
-            if github_profile.get('bio'):
-                confidence += indicators['has_bio']
-            
-            if github_profile.get('location'):
-                confidence += indicators['has_location']
-            
-            if github_profile.get('company'):
-                confidence += indicators['has_company']
-            
-            if github_profile.get('public_repos', 0) > 0:
-                confidence += indicators['has_repos']
-            
-            if github_profile.get('followers', 0) > 0:
-                confidence += indicators['has_activity']
-        
-        # Repository analysis
-        if github_repos:
-            # Check for recent activity
-            recent_repos = [repo for repo in github_repos 
-                          if self._is_recent_date(repo.get('updated_at', ''), 30)]
-            if recent_repos:
-                confidence += indicators['recent_commits']
-            
-            # Check for stars
-            total_stars = sum(repo.get('stars', 0) for repo in github_repos)
-            if total_stars > 0:
-                confidence += indicators['stars_received']
-        
-        return min(1.0, confidence / len(indicators))
+        return self._score_flags('github', self._github_flags(candidate))
     
     def _calculate_twitter_confidence(self, candidate: Dict) -> float:
         """
         Calculate Twitter profile confidence
         """
-        confidence = 0.0
-        indicators = self.quality_indicators['twitter']
-        
-        twitter_profile = candidate.get('twitter_profile', {})
-        
-        if twitter_profile:
-            confidence += indicators['profile_exists']
-            
-            # Note: Twitter API access is limited, so confidence is lower
-            # In a real implementation, you'd check for bio, location, etc.
-            confidence += indicators['has_bio'] * 0.5  # Reduced confidence
-        
-        return min(1.0, confidence / len(indicators))
+        return self._score_flags('twitter', self._twitter_flags(candidate))
     
     def _calculate_website_confidence(self, candidate: Dict) -> float:
         """
         Calculate personal website confidence
         """
-        confidence = 0.0
-        indicators = self.quality_indicators['website']
-        
-        personal_website = candidate.get('personal_website', {})
-        
-        if personal_website:
-            confidence += indicators['site_accessible']
-            
-            contact_info = personal_website.get('contact_info', {})
-            if contact_info.get('email') or contact_info.get('phone'):
-                confidence += indicators['has_contact_info']
-            
-            skills_found = personal_website.get('skills_found', [])
-            if skills_found:
-                confidence += indicators['has_skills_section']
-            
-            # Check for professional indicators
-            title = personal_website.get('title', '').lower()
-            description = personal_website.get('description', '').lower()
-            
-            professional_keywords = ['portfolio', 'resume', 'cv', 'developer', 'engineer']
-            if any(keyword in title or keyword in description for keyword in professional_keywords):
-                confidence += indicators['has_portfolio']
-            
-            if 'about' in title or 'about' in description:
-                confidence += indicators['has_about_section']
-        
-        return min(1.0, confidence / len(indicators))
+        return self._score_flags('website', self._website_flags(candidate))
     
     def _calculate_overall_confidence(self, metrics: ConfidenceMetrics) -> float:
         """
@@ -275,10 +384,12 @@ class ConfidenceScorer:
         
         return min(1.0, completeness)
     
-    def _calculate_data_freshness(self, candidate: Dict) -> float:
+    def _calculate_data_freshness(self, candidate: Dict, prepared: Optional[Dict] = None) -> float:
         """
         Calculate data freshness score
         """
+        if prepared is None:
+            prepared = self._prepare(candidate)
         freshness_scores = []
         
         # Check LinkedIn profile freshness (if we had timestamps)
@@ -286,11 +397,8 @@ class ConfidenceScorer:
         freshness_scores.append(0.7)
         
         # Check GitHub activity
-        github_repos = candidate.get('github_repos', [])
-        if github_repos:
-            recent_repos = [repo for repo in github_repos 
-                          if self._is_recent_date(repo.get('updated_at', ''), 30)]
-            github_freshness = len(recent_repos) / len(github_repos) if github_repos else 0.0
+        if prepared['github_repo_count']:
+            github_freshness = prepared['recent_repo_count'] / prepared['github_repo_count']
             freshness_scores.append(github_freshness)
         
         # Check website freshness (if we had timestamps)
@@ -299,46 +407,45 @@ class ConfidenceScorer:
         
         return sum(freshness_scores) / len(freshness_scores) if freshness_scores else 0.5
     
-    def _calculate_data_consistency(self, candidate: Dict) -> float:
+    def _calculate_data_consistency(self, candidate: Dict, prepared: Optional[Dict] = None) -> float:
         """
         Calculate data consistency score
         """
+        if prepared is None:
+            prepared = self._prepare(candidate)
         consistency_checks = []
         
         # Check name consistency across sources
-        name = candidate.get('name', '').lower()
-        github_name = candidate.get('github_profile', {}).get('name', '').lower()
+        name = prepared['name']
+        github_name = prepared['github_name']
         
         if name and github_name:
             name_similarity = self._calculate_name_similarity(name, github_name)
             consistency_checks.append(name_similarity)
         
         # Check location consistency
-        linkedin_location = candidate.get('location', '').lower()
-        github_location = candidate.get('github_profile', {}).get('location', '').lower()
+        linkedin_location = prepared['location']
+        github_location = prepared['github_location']
         
         if linkedin_location and github_location:
             location_similarity = self._calculate_location_similarity(linkedin_location, github_location)
             consistency_checks.append(location_similarity)
         
         # Check skills consistency
-        linkedin_skills = set(skill.lower() for skill in candidate.get('skills', []))
-        github_skills = set(skill.lower() for skill in candidate.get('github_skills', []))
-        website_skills = set(skill.lower() for skill in candidate.get('personal_website', {}).get('skills_found', []))
+        linkedin_skills = prepared['linkedin_skills']
+        github_skills = prepared['github_skills']
+        website_skills = prepared['website_skills']
         
         all_skills = linkedin_skills | github_skills | website_skills
         if all_skills:
             # Calculate overlap
             skill_overlaps = []
             if linkedin_skills and github_skills:
-                overlap = len(linkedin_skills & github_skills) / len(linkedin_skills | github_skills)
-                skill_overlaps.append(overlap)
+                skill_overlaps.append(self._jaccard(linkedin_skills, github_skills))
             if linkedin_skills and website_skills:
-                overlap = len(linkedin_skills & website_skills) / len(linkedin_skills | website_skills)
-                skill_overlaps.append(overlap)
+                skill_overlaps.append(self._jaccard(linkedin_skills, website_skills))
             if github_skills and website_skills:
-                overlap = len(github_skills & website_skills) / len(github_skills | website_skills)
-                skill_overlaps.append(overlap)
+                skill_overlaps.append(self._jaccard(github_skills, website_skills))
             
             if skill_overlaps:
                 consistency_checks.append(sum(skill_overlaps) / len(skill_overlaps))
@@ -366,52 +473,55 @@ class ConfidenceScorer:
         
         return min(1.0, reliability)
     
-    def _is_recent_date(self, date_string: str, days_threshold: int) -> bool:
+    def _count_recent(self, date_strings: List[str], days_threshold: int) -> int:
         """
-        Check if a date string is within the threshold
+        Count ISO timestamps (UTC, as returned by the GitHub API) newer than
+        the threshold; empty or unparseable values never count
         """
+        stamps = [date[:-1] if date.endswith('Z') else date for date in date_strings if date]
+        if not stamps:
+            return 0
+        
         try:
-            from datetime import datetime, timedelta
-            if not date_string:
-                return False
-            
-            date_obj = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-            threshold_date = datetime.now() - timedelta(days=days_threshold)
-            return date_obj > threshold_date
-        except:
-            return False
+            parsed = np.array(stamps, dtype='datetime64[s]')
+        except ValueError:
+            parsed = np.array([self._parse_timestamp(stamp) for stamp in stamps], dtype='datetime64[s]')
+        
+        threshold = np.datetime64('now', 's') - np.timedelta64(days_threshold * 86400, 's')
+        return int((parsed > threshold).sum())
+    
+    @staticmethod
+    def _parse_timestamp(stamp: str) -> np.datetime64:
+        try:
+            return np.datetime64(stamp, 's')
+        except ValueError:
+            return np.datetime64('NaT')
+    
+    @staticmethod
+    def _jaccard(set1: set, set2: set) -> float:
+        """
+        Jaccard similarity of two sets; the union size is derived from the
+        intersection instead of building the union set
+        """
+        if not set1 or not set2:
+            return 0.0
+        
+        intersection = len(set1 & set2)
+        return intersection / (len(set1) + len(set2) - intersection)
     
     def _calculate_name_similarity(self, name1: str, name2: str) -> float:
         """
         Calculate similarity between two names
         """
         # Simple word-based similarity
-        words1 = set(name1.split())
-        words2 = set(name2.split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-        
-        return intersection / union if union > 0 else 0.0
+        return self._jaccard(set(name1.split()), set(name2.split()))
     
     def _calculate_location_similarity(self, location1: str, location2: str) -> float:
         """
         Calculate similarity between two locations
         """
         # Simple word-based similarity
-        words1 = set(location1.split())
-        words2 = set(location2.split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-        
-        return intersection / union if union > 0 else 0.0
+        return self._jaccard(set(location1.split()), set(location2.split()))
     
     def get_confidence_summary(self, metrics: ConfidenceMetrics) -> Dict:
         """
@@ -440,27 +550,8 @@ class ConfidenceScorer:
         """
         Generate recommendations for improving confidence
         """
-        recommendations = []
-        
-        if metrics.overall < 0.7:
-            recommendations.append("Overall confidence is low - consider manual verification")
-        
-        if metrics.linkedin < 0.8:
-            recommendations.append("LinkedIn profile data is incomplete")
-        
-        if metrics.github < 0.6:
-            recommendations.append("GitHub profile could provide additional insights")
-        
-        if metrics.data_completeness < 0.6:
-            recommendations.append("Profile data is incomplete - missing key information")
-        
-        if metrics.data_freshness < 0.5:
-            recommendations.append("Data may be outdated - consider recent updates")
-        
-        if metrics.data_consistency < 0.7:
-            recommendations.append("Data consistency issues detected across sources")
-        
-        if not recommendations:
-            recommendations.append("Profile data quality is good")
-        
-        return recommendations 
\ No newline at end of file
+        recommendations = [
+            message for metric, threshold, message in self.RECOMMENDATION_RULES
+            if metric(metrics) < threshold
+        ]
+        return recommendations or ["Profile data quality is good"]
@@ -9,8 +9,17 @@ class Config:
     OPENROUTER_MODEL = "meta-llama/llama-3-70b-instruct"
     
     # LinkedIn Search Configuration
+    # With a Serper key, X-Ray searches go to its Google Search JSON API
+    # instead of driving a browser through google.com
+    SERPER_API_KEY = os.getenv('SERPER_API_KEY')
+    SERPER_SEARCH_URL = "https://google.serper.dev/search"
+    BROWSER_POOL_SIZE = 4  # Chrome instances shared by all searchers
     LINKEDIN_SEARCH_DELAY = 2  # seconds between requests
     MAX_SEARCH_RESULTS = 50
+    ENRICHMENT_CONCURRENCY = 5  # candidates enriched at once to start with
+    ENRICHMENT_MAX_CONCURRENCY = 32
+    ENRICHMENT_LATENCY_TARGET = 15.0  # seconds per candidate before concurrency stops growing
+    ENRICHMENT_RPM = 60  # starting request budget per minute, adapted to rate-limit headers
     
     # Scoring Weights
     SCORING_WEIGHTS = {
@@ -35,6 +44,10 @@ class Config:
         'Anthropic', 'Databricks', 'Snowflake', 'MongoDB', 'Atlassian'
     ]
     
+    # Case-folded copies, built once for the scorer's substring checks
+    ELITE_SCHOOLS_NORMALIZED = tuple(school.casefold() for school in ELITE_SCHOOLS)
+    TOP_TECH_COMPANIES_NORMALIZED = tuple(company.casefold() for company in TOP_TECH_COMPANIES)
+    
     # Database Configuration
     DATABASE_PATH = "linkedin_sourcing.db"
     
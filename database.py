@@ -1,16 +1,66 @@
 import sqlite3
 import json
+import threading
+import zlib
 from datetime import datetime
 from config import Config
 
+CANDIDATE_COLUMNS = (
+    'id', 'job_id', 'name', 'linkedin_url', 'headline', 'current_company', 'location',
+    'education', 'experience', 'skills', 'fit_score', 'score_breakdown', 'outreach_message',
+    'created_at'
+)
+JSON_FIELDS = ('education', 'experience', 'skills', 'score_breakdown')
+
+# Large text columns that may be stored zlib-compressed
+PACKED_FIELDS = JSON_FIELDS + ('outreach_message',)
+_PACK_THRESHOLD = 512  # characters; shorter values are not worth compressing
+
+# Compact JSON for stored columns (no spaces after ',' and ':')
+_encode_json = json.JSONEncoder(separators=(',', ':')).encode
+
+def _pack(text):
+    """Compress long text into a BLOB when that actually saves space"""
+    if text is None or len(text) < _PACK_THRESHOLD:
+        return text
+    packed = zlib.compress(text.encode('utf-8'))
+    return packed if len(packed) < len(text) else text
+
+def _unpack(value):
+    """Inverse of _pack; rows written as plain TEXT come back unchanged"""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode('utf-8')
+    return value
+
 class Database:
     def __init__(self, db_path=None):
         self.db_path = db_path or Config.DATABASE_PATH
+        # One long-lived connection per thread instead of connect/close per query
+        self._tls = threading.local()
         self.init_database()
     
+    def _conn(self):
+        """Get the calling thread's connection, opening it on first use"""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA cache_size=-20000')
+            self._tls.conn = conn
+        return conn
+    
+    def close(self):
+        """Close the calling thread's connection"""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is not None:
+            conn.close()
+            del self._tls.conn
+    
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         # Jobs table
@@ -46,12 +96,17 @@ class Database:
             )
         ''')
         
+        # Serves get_candidates_for_job's filter and sort from one index scan
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_candidates_job_score
+            ON candidates (job_id, fit_score DESC)
+        ''')
+        
         conn.commit()
-        conn.close()
     
     def save_job(self, job_description, company_name=None, position_title=None, location=None):
         """Save a new job to the database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -61,66 +116,78 @@ class Database:
         
         job_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         return job_id
     
     def save_candidate(self, job_id, candidate_data):
         """Save a candidate to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO candidates 
-            (job_id, name, linkedin_url, headline, current_company, location, 
-             education, experience, skills, fit_score, score_breakdown, outreach_message)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            job_id,
-            candidate_data.get('name'),
-            candidate_data.get('linkedin_url'),
-            candidate_data.get('headline'),
-            candidate_data.get('current_company'),
-            candidate_data.get('location'),
-            json.dumps(candidate_data.get('education', [])),
-            json.dumps(candidate_data.get('experience', [])),
-            json.dumps(candidate_data.get('skills', [])),
-            candidate_data.get('fit_score'),
-            json.dumps(candidate_data.get('score_breakdown', {})),
-            candidate_data.get('outreach_message')
-        ))
+        self.save_candidates(job_id, [candidate_data])
+    
+    def save_candidates(self, job_id, candidates):
+        """Save many candidates in a single transaction"""
+        conn = self._conn()
+        rows = (
+            (
+                job_id,
+                candidate_data.get('name'),
+                candidate_data.get('linkedin_url'),
+                candidate_data.get('headline'),
+                candidate_data.get('current_company'),
+                candidate_data.get('location'),
+                _pack(_encode_json(candidate_data.get('education', []))),
+                _pack(_encode_json(candidate_data.get('experience', []))),
+                _pack(_encode_json(candidate_data.get('skills', []))),
+                candidate_data.get('fit_score'),
+                _pack(_encode_json(candidate_data.get('score_breakdown', {}))),
+                _pack(candidate_data.get('outreach_message'))
+            )
+            for candidate_data in candidates
+        )
         
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO candidates 
+                (job_id, name, linkedin_url, headline, current_company, location, 
+                 education, experience, skills, fit_score, score_breakdown, outreach_message)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
     
     def get_candidates_for_job(self, job_id):
         """Retrieve all candidates for a specific job"""
-        conn = sqlite3.connect(self.db_path)
+        return list(self.iter_candidates(job_id))
+    
+    def iter_candidates(self, job_id, columns=CANDIDATE_COLUMNS):
+        """Yield a job's candidates best-first, fetching only the given columns"""
+        unknown = set(columns) - set(CANDIDATE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown candidate columns: {sorted(unknown)}")
+        
+        conn = self._conn()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT * FROM candidates WHERE job_id = ? ORDER BY fit_score DESC
+        cursor.execute(f'''
+            SELECT {', '.join(columns)} FROM candidates WHERE job_id = ? ORDER BY fit_score DESC
         ''', (job_id,))
         
-        columns = [description[0] for description in cursor.description]
-        candidates = []
+        # Only decode the fields that were actually selected
+        packed_fields = [field for field in PACKED_FIELDS if field in columns]
+        json_fields = [field for field in JSON_FIELDS if field in columns]
         
-        for row in cursor.fetchall():
+        for row in cursor:
             candidate = dict(zip(columns, row))
+            for field in packed_fields:
+                candidate[field] = _unpack(candidate[field])
             # Parse JSON fields
-            for field in ['education', 'experience', 'skills', 'score_breakdown']:
+            for field in json_fields:
                 if candidate[field]:
                     candidate[field] = json.loads(candidate[field])
                 else:
                     candidate[field] = []
-            candidates.append(candidate)
-        
-        conn.close()
-        return candidates
+            yield candidate
     
     def get_job(self, job_id):
         """Retrieve a specific job"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
@@ -132,5 +199,4 @@ class Database:
         else:
             job = None
         
-        conn.close()
         return job 
\ No newline at end of file
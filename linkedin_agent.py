@@ -4,121 +4,473 @@ from message_generator import MessageGenerator
 from database import Database
 from multi_source_collector import MultiSourceCollector
 from smart_cache import SmartCache
+from config import Config
+import asyncio
+import concurrent.futures
+import csv
+import functools
+import hashlib
+import io
 import json
-from datetime import datetime
+import logging
+import threading
 import time
+from collections import deque
+from datetime import datetime
+
+# Pipeline progress; main.py's configure_logging() prints it to the console
+logger = logging.getLogger(__name__)
+
+CSV_HEADER = (
+    'Name', 'LinkedIn URL', 'Fit Score', 'Education', 'Trajectory', 'Company',
+    'Skills', 'Location', 'Tenure', 'Outreach Message'
+)
+CSV_SCORE_FIELDS = ('education', 'trajectory', 'company', 'skills', 'location', 'tenure')
+
+# Fields reported for each top candidate in job results, with the type
+# whose empty value stands in for a missing field
+TOP_CANDIDATE_FIELDS = (
+    ('name', str),
+    ('linkedin_url', str),
+    ('fit_score', float),
+    ('score_breakdown', dict),
+    ('outreach_message', str)
+)
+TOP_CANDIDATES_LIMIT = 5
+
+def _format_top_candidates(candidates):
+    """The preferred result structure for the best TOP_CANDIDATES_LIMIT candidates"""
+    return [
+        {field: candidate[field] if field in candidate else empty() for field, empty in TOP_CANDIDATE_FIELDS}
+        for candidate in candidates[:TOP_CANDIDATES_LIMIT]
+    ]
+
+class RateLimiter:
+    """
+    Sliding-window limiter shared by every agent, usable as `async with`.
+    Grants at most `rpm` requests per `time_period` seconds. The effective
+    rate reacts to the provider's rate-limit headers (AIMD): it is halved when
+    a 429 arrives or the remaining quota runs low, and grows back by one on
+    each healthy response. A `Retry-After` blocks new requests until it passes.
+    """
+    
+    REMAINING_THRESHOLD = 5  # x-ratelimit-remaining below this backs off
+    MIN_RPM = 1
+    
+    def __init__(self, rpm, time_period=60):
+        self.max_rpm = rpm
+        self.rpm = rpm
+        self.time_period = time_period
+        self._recent = deque()  # monotonic timestamps of granted requests
+        self._blocked_until = 0.0
+        self.throttle_count = 0  # responses that triggered a back-off
+        # observe() runs on executor threads, acquire() on any agent's loop
+        self._lock = threading.Lock()
+    
+    async def acquire(self):
+        """Wait until a request slot is free, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0] >= self.time_period:
+                    self._recent.popleft()
+                if now >= self._blocked_until and len(self._recent) < self.rpm:
+                    self._recent.append(now)
+                    return
+                wait = self._blocked_until - now
+                if len(self._recent) >= self.rpm:
+                    wait = max(wait, self._recent[0] + self.time_period - now)
+            await asyncio.sleep(wait)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+    
+    def observe(self, status_code, headers):
+        """Adapt the rate to one HTTP response"""
+        remaining = self._header_number(headers, 'x-ratelimit-remaining')
+        retry_after = self._header_number(headers, 'retry-after')
+        with self._lock:
+            if status_code == 429 or (remaining is not None and remaining < self.REMAINING_THRESHOLD):
+                self.throttle_count += 1
+                self.rpm = max(self.MIN_RPM, self.rpm // 2)
+                if retry_after:
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            elif self.rpm < self.max_rpm:
+                self.rpm += 1
+    
+    def observe_response(self, response, *args, **kwargs):
+        """requests response hook"""
+        self.observe(response.status_code, response.headers)
+    
+    @staticmethod
+    def _header_number(headers, name):
+        value = headers.get(name)
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None  # e.g. an HTTP-date Retry-After
+
+class ConcurrencyController:
+    """
+    AIMD limit on in-flight enrichments, usable as `async with`.
+    While the average latency over the last `window` completions stays within
+    `latency_target` the limit grows by `alpha` per completion; an error or
+    throttled response halves it. Create it inside the event loop that uses it.
+    """
+    
+    def __init__(self, c_initial, c_min=1, c_max=32, latency_target=15.0, window=10, alpha=0.5):
+        self.c_min = c_min
+        self.c_max = c_max
+        self.c_current = float(min(max(c_initial, c_min), c_max))
+        self.latency_target = latency_target
+        self.alpha = alpha
+        self._latencies = deque(maxlen=window)
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+    
+    @property
+    def limit(self):
+        return int(self.c_current)
+    
+    async def __aenter__(self):
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._changed:
+            self._in_flight -= 1
+            self._changed.notify_all()
+        return False
+    
+    def record(self, latency):
+        """Additive increase while recent latency is on target"""
+        self._latencies.append(latency)
+        if sum(self._latencies) / len(self._latencies) <= self.latency_target:
+            self.c_current = min(self.c_max, self.c_current + self.alpha)
+    
+    def on_error(self):
+        """Multiplicative decrease; latencies seen before the error no longer count"""
+        self.c_current = max(self.c_min, self.c_current * 0.5)
+        self._latencies.clear()
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+def get_rate_limiter():
+    """The process-wide RateLimiter, so every agent draws on one quota"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(Config.ENRICHMENT_RPM)
+        return _rate_limiter
+
+# Searches currently running in any agent, keyed by search query, so parallel
+# agents given the same job wait for one search instead of repeating it
+_inflight_searches = {}
+_inflight_searches_lock = threading.Lock()
 
 class LinkedInSourcingAgent:
     def __init__(self):
-        self.searcher = LinkedInSearcher()
-        self.scorer = CandidateScorer()
-        self.message_generator = MessageGenerator()
+        # Everything else (browser, HTTP session, caches) is built on first
+        # use, so the results/export path only ever opens the database
         self.database = Database()
-        self.multi_source_collector = MultiSourceCollector()
-        self.smart_cache = SmartCache()
+        self.rate_limiter = get_rate_limiter()
+        # Profile fetches in flight on this agent's event loop, keyed by URL
+        self._inflight = {}
+    
+    def close(self):
+        """
+        Release the searcher and this thread's database connection. Pooled
+        browsers and the collectors' HTTP session are shared by every agent
+        and stay open.
+        """
+        searcher = self.__dict__.pop('searcher', None)
+        if searcher is not None:
+            searcher.close()
+        self.database.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    @functools.cached_property
+    def searcher(self):
+        return LinkedInSearcher()
+    
+    @functools.cached_property
+    def scorer(self):
+        return CandidateScorer()
+    
+    @functools.cached_property
+    def message_generator(self):
+        return MessageGenerator()
+    
+    @functools.cached_property
+    def smart_cache(self):
+        return SmartCache()
+    
+    @functools.cached_property
+    def multi_source_collector(self):
+        collector = MultiSourceCollector()
+        # Collector responses feed the shared limiter (the session is shared too)
+        response_hooks = collector.session.hooks['response']
+        if self.rate_limiter.observe_response not in response_hooks:
+            response_hooks.append(self.rate_limiter.observe_response)
+        return collector
     
     def process_job(self, job_description, company_name=None, position_title=None, location=None, max_candidates=20):
         """
         Complete pipeline: search → extract details → score → generate messages
         """
-        print(f"🚀 Starting LinkedIn sourcing for job...")
+        logger.info("🚀 Starting LinkedIn sourcing for job...")
         
         # Save job to database
         job_id = self.database.save_job(job_description, company_name, position_title, location)
-        print(f"📝 Job saved with ID: {job_id}")
+        logger.info("📝 Job saved with ID: %s", job_id)
         
         # Step 1: Search for candidates
-        print("🔍 Searching for LinkedIn profiles...")
+        logger.info("🔍 Searching for LinkedIn profiles...")
         
         # Check cache for search results
-        search_query = f"{job_description[:100]} {company_name or ''} {location or ''}"
+        search_query = self._search_cache_key(
+            LinkedInSearcher.build_xray_query(job_description), max_candidates
+        )
         cached_results = self.smart_cache.get_cached_search_results(search_query)
         
         if cached_results:
-            print(f"✅ Found {len(cached_results)} candidates in cache")
+            logger.info("✅ Found %d candidates in cache", len(cached_results))
             candidates = cached_results
         else:
-            candidates = self.searcher.search_linkedin_profiles(job_description, max_candidates)
-            print(f"✅ Found {len(candidates)} candidates")
-            
-            # Cache the search results
-            self.smart_cache.cache_search_results(search_query, candidates)
-            print("💾 Cached search results")
+            candidates = self._search(search_query, job_description, max_candidates)
+            logger.info("✅ Found %d candidates", len(candidates))
         
-        # Step 2: Extract detailed profile information
-        print("📋 Extracting detailed profile information...")
-        enhanced_candidates = []
-        for i, candidate in enumerate(candidates):
-            try:
-                print(f"   Extracting details for {candidate['name']} ({i+1}/{len(candidates)})")
-                
-                # Check cache for profile details
-                cached_profile = self.smart_cache.get_cached_linkedin_profile(candidate['linkedin_url'])
-                
-                if cached_profile:
-                    print(f"   ✅ Found profile in cache for {candidate['name']}")
-                    profile_details = cached_profile
-                else:
-                    profile_details = self.searcher.get_profile_details(candidate['linkedin_url'])
-                    # Cache the profile details
-                    self.smart_cache.cache_linkedin_profile(candidate['linkedin_url'], profile_details)
-                    print(f"   💾 Cached profile for {candidate['name']}")
-                
-                # Merge profile details with candidate data
-                enhanced_candidate = candidate.copy()
-                enhanced_candidate.update(profile_details)
-                
-                # Step 2.5: Multi-source enhancement
-                print(f"   🔍 Enhancing with multi-source data for {candidate['name']}")
-                enhanced_candidate = self.multi_source_collector.enhance_candidate_data(enhanced_candidate)
-                
-                enhanced_candidates.append(enhanced_candidate)
-                
-                # Add delay to avoid rate limiting
-                time.sleep(2)
-                
-            except Exception as e:
-                print(f"   ❌ Error extracting details for {candidate['name']}: {e}")
-                enhanced_candidates.append(candidate)
-        
-        print(f"✅ Enhanced {len(enhanced_candidates)} candidates with detailed information")
-        
-        # Step 3: Score candidates
-        print("📊 Scoring candidates...")
-        scored_candidates = self.scorer.score_candidates(enhanced_candidates, job_description)
-        print(f"✅ Scored {len(scored_candidates)} candidates")
+        # Steps 2-3: Extract detailed profile information, scoring each
+        # candidate as soon as its enrichment completes
+        logger.info("📋 Extracting detailed profile information and scoring candidates...")
+        scored_candidates = asyncio.run(self._enrich_and_score(candidates, job_description))
+        logger.info("✅ Enhanced and scored %d candidates", len(scored_candidates))
         
         # Step 4: Generate outreach messages
-        print("💬 Generating outreach messages...")
+        logger.info("💬 Generating outreach messages...")
         final_candidates = self.message_generator.generate_outreach_messages(
             scored_candidates, job_description, max_messages=5
         )
-        print(f"✅ Generated messages for top {len(final_candidates)} candidates")
+        logger.info("✅ Generated messages for top %d candidates", len(final_candidates))
         
         # Step 5: Save candidates to database
-        for candidate in final_candidates:
-            self.database.save_candidate(job_id, candidate)
+        self.database.save_candidates(job_id, final_candidates)
         
         # Step 6: Return results in preferred format
-        top_candidates_formatted = []
-        for candidate in final_candidates[:5]:  # Top 5 candidates
-            formatted_candidate = {
-                "name": candidate.get('name', ''),
-                "linkedin_url": candidate.get('linkedin_url', ''),
-                "fit_score": candidate.get('fit_score', 0.0),
-                "score_breakdown": candidate.get('score_breakdown', {}),
-                "outreach_message": candidate.get('outreach_message', '')
-            }
-            top_candidates_formatted.append(formatted_candidate)
-        
         result = {
             "job_id": str(job_id),
             "candidates_found": len(candidates),
-            "top_candidates": top_candidates_formatted
+            "top_candidates": _format_top_candidates(final_candidates)
         }
         
         return result
     
+    async def _enrich_and_score(self, candidates, job_description, concurrency=None):
+        """
+        Enrich candidates concurrently and score each one as it completes, so
+        scoring overlaps the slowest enrichments instead of following them.
+        Returns every candidate best first, ties in search order.
+        """
+        job = self.scorer.preprocess_job(job_description)
+        scored_candidates = [None] * len(candidates)
+        async for index, enhanced_candidate in self._enrich_as_completed(candidates, concurrency):
+            scored_candidates[index] = self.scorer.score_candidate(enhanced_candidate, job)
+        
+        scored_candidates.sort(key=lambda x: x['fit_score'], reverse=True)
+        return scored_candidates
+    
+    async def _enrich_as_completed(self, candidates, concurrency=None):
+        """
+        Enrich all candidates concurrently, yielding (index, candidate) pairs
+        in completion order. In-flight work starts at `concurrency` and adapts
+        to observed latency and throttling. A candidate whose enrichment fails
+        is yielded unchanged.
+        """
+        controller = ConcurrencyController(
+            concurrency or Config.ENRICHMENT_CONCURRENCY,
+            c_max=Config.ENRICHMENT_MAX_CONCURRENCY,
+            latency_target=Config.ENRICHMENT_LATENCY_TARGET
+        )
+        total = len(candidates)
+        
+        async def enrich(index, candidate):
+            try:
+                return index, await self._enrich(controller, candidate, index, total)
+            except Exception as e:
+                logger.warning("   ❌ Error extracting details for %s: %s", candidate['name'], e)
+                return index, candidate
+        
+        for completed in asyncio.as_completed([enrich(i, candidate) for i, candidate in enumerate(candidates)]):
+            yield await completed
+    
+    async def _enrich(self, controller, candidate, index, total):
+        """Enrich one candidate within the controller's limit, reporting how it went"""
+        async with controller:
+            throttled = self.rate_limiter.throttle_count
+            started = time.monotonic()
+            try:
+                enhanced_candidate = await self._enrich_candidate(candidate, index, total)
+            except Exception:
+                controller.on_error()
+                raise
+            if self.rate_limiter.throttle_count != throttled:
+                controller.on_error()
+            else:
+                controller.record(time.monotonic() - started)
+            return enhanced_candidate
+    
+    async def _enrich_candidate(self, candidate, index, total):
+        """Profile details (cached or scraped) plus multi-source data for one candidate"""
+        loop = asyncio.get_event_loop()
+        logger.info("   Extracting details for %s (%d/%d)", candidate['name'], index+1, total)
+        profile_details = await self._get_profile(candidate)
+        
+        # Merge profile details with candidate data in one dict build; a real
+        # dict (not a view) since profile_details may be shared between waiters
+        enhanced_candidate = {**candidate, **profile_details}
+        
+        # Step 2.5: Multi-source enhancement, skipped when this exact
+        # candidate content was already enhanced
+        linkedin_url = candidate['linkedin_url']
+        content_hash = hashlib.blake2b(
+            json.dumps(enhanced_candidate, sort_keys=True, default=str).encode('utf-8'), digest_size=8
+        ).hexdigest()
+        cached_candidate = await loop.run_in_executor(
+            None, self.smart_cache.get_cached_enhanced_candidate, linkedin_url, content_hash
+        )
+        if cached_candidate:
+            logger.info("   ✅ Found multi-source data in cache for %s", candidate['name'])
+            return cached_candidate
+        
+        logger.info("   🔍 Enhancing with multi-source data for %s", candidate['name'])
+        async with self.rate_limiter:
+            enhanced_candidate = await loop.run_in_executor(
+                None, self.multi_source_collector.enhance_candidate_data, enhanced_candidate
+            )
+        # On failure the collector hands back its input, which has no confidence
+        if 'data_confidence' in enhanced_candidate:
+            await loop.run_in_executor(
+                None, self.smart_cache.cache_enhanced_candidate, linkedin_url, content_hash, enhanced_candidate
+            )
+        return enhanced_candidate
+    
+    async def _get_profile(self, candidate):
+        """
+        Profile details from the cache or a fresh scrape. Concurrent lookups
+        of the same URL share one in-flight scrape rather than each making it.
+        """
+        loop = asyncio.get_event_loop()
+        linkedin_url = candidate['linkedin_url']
+        
+        # Check cache for profile details
+        cached_profile = await loop.run_in_executor(
+            None, self.smart_cache.get_cached_linkedin_profile, linkedin_url
+        )
+        if cached_profile:
+            logger.info("   ✅ Found profile in cache for %s", candidate['name'])
+            return cached_profile
+        
+        inflight = self._inflight.get(linkedin_url)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        future = self._inflight[linkedin_url] = loop.create_future()
+        try:
+            async with self.rate_limiter:
+                profile_details = await loop.run_in_executor(
+                    None, self.searcher.get_profile_details, linkedin_url
+                )
+            # Cache the profile details before waiters are released, so later
+            # lookups hit the cache rather than starting another scrape
+            await loop.run_in_executor(
+                None, self.smart_cache.cache_linkedin_profile, linkedin_url, profile_details
+            )
+            logger.info("   💾 Cached profile for %s", candidate['name'])
+            future.set_result(profile_details)
+            return profile_details
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; don't also log it as unretrieved
+            raise
+        finally:
+            del self._inflight[linkedin_url]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _search_cache_key(xray_query, max_results):
+        """
+        Stable key for a search: a hash of the X-Ray query actually issued
+        and the result limit, so job descriptions that build the same query
+        share results and a short result list never serves a longer request
+        """
+        normalized = f"{' '.join(xray_query.split())}|{max_results}"
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _search(self, search_query, job_description, max_candidates):
+        """Search and cache the results, joining an identical search already running"""
+        with _inflight_searches_lock:
+            future = _inflight_searches.get(search_query)
+            owner = future is None
+            if owner:
+                future = _inflight_searches[search_query] = concurrent.futures.Future()
+        if not owner:
+            return future.result()
+        
+        try:
+            candidates = self.searcher.search_linkedin_profiles(job_description, max_candidates)
+            
+            # Cache the search results
+            self.smart_cache.cache_search_results(search_query, candidates)
+            logger.info("💾 Cached search results")
+            future.set_result(candidates)
+            return candidates
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_searches_lock:
+                del _inflight_searches[search_query]
+    
+    async def process_job_async(self, job_description, company_name=None, position_title=None, location=None, max_candidates=20, executor=None):
+        """
+        Awaitable version of process_job for use from an event loop.
+        The search/enrichment stack (Selenium + requests) is blocking, so the
+        pipeline runs on `executor` (the loop's default one if None) and the
+        caller only awaits its completion.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(
+                self.process_job,
+                job_description,
+                company_name=company_name,
+                position_title=position_title,
+                location=location,
+                max_candidates=max_candidates
+            )
+        )
+    
     def search_linkedin(self, job_description, max_results=20):
         """
         Step 1: Find LinkedIn profiles
@@ -146,22 +498,10 @@ class LinkedInSourcingAgent:
         job = self.database.get_job(job_id)
         candidates = self.database.get_candidates_for_job(job_id)
         
-        # Format candidates in preferred structure
-        top_candidates_formatted = []
-        for candidate in candidates[:5]:  # Top 5 candidates
-            formatted_candidate = {
-                "name": candidate.get('name', ''),
-                "linkedin_url": candidate.get('linkedin_url', ''),
-                "fit_score": candidate.get('fit_score', 0.0),
-                "score_breakdown": candidate.get('score_breakdown', {}),
-                "outreach_message": candidate.get('outreach_message', '')
-            }
-            top_candidates_formatted.append(formatted_candidate)
-        
         return {
             "job_id": str(job_id),
             "candidates_found": len(candidates),
-            "top_candidates": top_candidates_formatted
+            "top_candidates": _format_top_candidates(candidates)
         }
     
     def export_results(self, job_id, format='json'):
@@ -173,12 +513,22 @@ class LinkedInSourcingAgent:
         if format == 'json':
             return json.dumps(results, indent=2, default=str)
         elif format == 'csv':
-            # Simple CSV export with essential fields
-            csv_lines = ["Name,LinkedIn URL,Fit Score,Education,Trajectory,Company,Skills,Location,Tenure,Outreach Message"]
-            for candidate in results['top_candidates']:
-                score_breakdown = candidate.get('score_breakdown', {})
-                csv_lines.append(f'"{candidate["name"]}","{candidate["linkedin_url"]}",{candidate["fit_score"]},{score_breakdown.get("education", 0)},{score_breakdown.get("trajectory", 0)},{score_breakdown.get("company", 0)},{score_breakdown.get("skills", 0)},{score_breakdown.get("location", 0)},{score_breakdown.get("tenure", 0)},"{candidate["outreach_message"]}"')
-            return '\n'.join(csv_lines)
+            # Simple CSV export with essential fields; csv handles quoting of
+            # commas, quotes and newlines inside outreach messages
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            writer.writerow(CSV_HEADER)
+            writer.writerows(
+                (
+                    candidate['name'],
+                    candidate['linkedin_url'],
+                    candidate['fit_score'],
+                    *(candidate.get('score_breakdown', {}).get(field, 0) for field in CSV_SCORE_FIELDS),
+                    candidate['outreach_message']
+                )
+                for candidate in results['top_candidates']
+            )
+            return buffer.getvalue()
         else:
             return results
     
@@ -1,98 +1,519 @@
-import time
+import asyncio
+import atexit
+import functools
+import itertools
+import os
+import queue
+import threading
 import re
+import requests
+from contextlib import contextmanager
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from config import Config
 
-class LinkedInSearcher:
-    def __init__(self):
-        self.driver = None
-        self.setup_driver()
-
-    def setup_driver(self):
-        """Setup Chrome WebDriver with webdriver-manager for automatic ChromeDriver management"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run in background
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument(f"--user-agent={Config.USER_AGENT}")
+# Terms matched against job descriptions, in priority order
+JOB_TITLES = (
+    'machine learning engineer', 'ml engineer', 'ai engineer', 'research engineer',
+    'software engineer', 'backend engineer', 'frontend engineer', 'full stack engineer',
+    'data scientist', 'devops engineer', 'product manager', 'senior engineer',
+    'lead engineer', 'principal engineer', 'research scientist', 'applied scientist'
+)
+JOB_SKILLS = (
+    'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
+    'machine learning', 'ai', 'ml', 'data science', 'backend', 'frontend', 'full stack',
+    'pytorch', 'tensorflow', 'llm', 'neural networks', 'deep learning', 'nlp',
+    'computer vision', 'reinforcement learning', 'statistics', 'sql', 'nosql'
+)
+
+# Skills recognized in profile page text, in reporting order
+PROFILE_TECH_SKILLS = (
+    'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
+    'machine learning', 'ai', 'ml', 'data science', 'backend', 'frontend', 'full stack',
+    'sql', 'nosql', 'mongodb', 'postgresql', 'redis', 'elasticsearch', 'kafka',
+    'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'git', 'jenkins',
+    'terraform', 'ansible', 'microservices', 'api', 'rest', 'graphql', 'html', 'css',
+    'typescript', 'angular', 'vue.js', 'express.js', 'django', 'flask', 'spring',
+    'hibernate', 'junit', 'maven', 'gradle', 'npm', 'yarn', 'webpack', 'babel',
+    'jest', 'cypress', 'selenium', 'jira', 'confluence', 'slack', 'zoom', 'figma',
+    'sketch', 'adobe', 'photoshop', 'illustrator', 'invision', 'zeplin'
+)
+MAX_PROFILE_SKILLS = 10
+# (skill, display name) pairs, so matches are not re-title-cased per profile
+_TITLED_TECH_SKILLS = tuple((skill, skill.title()) for skill in PROFILE_TECH_SKILLS)
+
+def _find_tech_skills(page_lower):
+    """
+    The first MAX_PROFILE_SKILLS of PROFILE_TECH_SKILLS found in already
+    lowercased page text, title-cased; stops scanning once that many match
+    """
+    found = (titled for skill, titled in _TITLED_TECH_SKILLS if skill in page_lower)
+    return list(itertools.islice(found, MAX_PROFILE_SKILLS))
+
+# Patterns used by the _extract_* helpers, compiled once at import. The ones
+# run over whole pages of text cap their name runs at 59 characters: an
+# unbounded [A-Za-z\s&]+ backtracks quadratically over long letter runs.
+# They are also compiled with re.ASCII, whose case folding is cheaper than
+# the Unicode tables; _page_text() maps the whitespace that only Unicode \s
+# matches to plain spaces so those patterns see the same separators
+_WHITESPACE_RUN = re.compile(r'\s+')
+_DIGITS = re.compile(r'\d+')
+
+_LOCATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:in|at|based in|located in)\s+([A-Za-z\s,]+?)(?:\s+and|\s+we|\s+is|\s+looking)',
+    r'([A-Za-z\s,]+?),\s*[A-Z]{2}(?:\s+and|\s+we|\s+is|\s+looking)',
+    r'remote\s+(?:from\s+)?([A-Za-z\s,]+)',
+    r'([A-Za-z\s,]+?)\s+area'
+))
+_COMPANY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'at\s+([A-Z][A-Za-z\s&]+?)(?:\s+is|\s+in|\s+seeks|\s+looking|\s+we)',
+    r'([A-Z][A-Za-z\s&]+?)\s+is\s+looking',
+    r'([A-Z][A-Za-z\s&]+?)\s+seeks',
+    r'join\s+([A-Z][A-Za-z\s&]+?)',
+    r'work\s+at\s+([A-Z][A-Za-z\s&]+?)'
+))
+_SNIPPET_HEADLINE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'([^•]+) at ([^•]+)',
+    r'([^•]+) - ([^•]+)',
+    r'([^•]+) \| ([^•]+)'
+))
+_SNIPPET_COMPANY_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'at ([^•\n]+)',
+    r'- ([^•\n]+)',
+    r'\| ([^•\n]+)'
+))
+_SNIPPET_LOCATION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'([A-Za-z\s]+), ([A-Z]{2})',
+    r'([A-Za-z\s]+), ([A-Za-z\s]+)',
+))
+_TEXT_EDUCATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.ASCII) for pattern in (
+    r'([A-Z][A-Za-z\s&]{1,58}(?:University|College|Institute|School))',
+    r'(Bachelor|Master|PhD|MBA|BSc|MSc|MS|MA|BS|BA)\s+(?:of|in|from)\s+([A-Z][A-Za-z\s&]{1,58})',
+    r'([A-Z][A-Za-z\s&]{1,58})\s+(?:University|College|Institute|School)'
+))
+_FALLBACK_EDUCATION_PATTERNS = _TEXT_EDUCATION_PATTERNS + tuple(re.compile(pattern, re.IGNORECASE | re.ASCII) for pattern in (
+    r'(MIT|Stanford|Harvard|Berkeley|CMU|Caltech|Princeton|Yale|Columbia|Cornell|UCLA|UCSD)',
+    r'(Bachelor|Master|PhD|MBA|BSc|MSc|MS|MA|BS|BA)\s+(?:degree|in|of)',
+))
+_FALLBACK_EXPERIENCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.ASCII) for pattern in (
+    r'([A-Z][A-Za-z\s&]{1,58})\s+(?:at|@)\s+([A-Z][A-Za-z\s&]{1,58})',
+    r'(Senior|Lead|Principal|Software|Data|ML|AI|Full Stack|Backend|Frontend)\s+(Engineer|Developer|Scientist|Architect|Manager)',
+    r'([A-Z][A-Za-z\s&]{1,58})\s+(?:Engineer|Developer|Scientist|Architect|Manager)',
+))
+
+# Characters str.isspace() accepts but re.ASCII's \s does not
+_UNICODE_SPACES = str.maketrans(dict.fromkeys(
+    '\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005'
+    '\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000', ' '
+))
+
+# Runs in the page: arguments are (container selectors, per-selector limit,
+# field selector lists). Replaces a find_element round-trip per selector
+_PROFILE_SECTIONS_SCRIPT = """
+const [containerSelectors, limit, fieldSelectors] = arguments;
+return containerSelectors.map(selector =>
+    Array.from(document.querySelectorAll(selector)).slice(0, limit).map(element =>
+        fieldSelectors.map(selectors => selectors.flatMap(fieldSelector => {
+            const field = element.querySelector(fieldSelector);
+            return field ? [(field.innerText || '').trim()] : [];
+        }))
+    )
+);
+"""
+
+# Runs in the page: arguments are (result container selectors, max results,
+# snippet selectors). Uses the first container selector with any match and
+# returns [selector, match count, results], where each result with a
+# LinkedIn profile link is {href, title, snippet}
+_SEARCH_RESULTS_SCRIPT = """
+const [containerSelectors, maxResults, snippetSelectors] = arguments;
+const text = element => element ? (element.innerText || '').trim() : '';
+for (const selector of containerSelectors) {
+    const containers = Array.from(document.querySelectorAll(selector));
+    if (!containers.length) continue;
+    const results = [];
+    for (const container of containers.slice(0, maxResults)) {
+        const link = Array.from(container.querySelectorAll('a'))
+            .find(a => a.href && a.href.includes('linkedin.com/in/'));
+        if (!link) continue;
+        let title = text(link);
+        if (!title) {
+            const heading = container.querySelector('h3, h2');
+            title = heading ? text(heading) : 'LinkedIn Profile';
+        }
+        let snippet = '';
+        for (const snippetSelector of snippetSelectors) {
+            snippet = text(container.querySelector(snippetSelector));
+            if (snippet) break;
+        }
+        results.push({href: link.href, title: title, snippet: snippet});
+    }
+    return [selector, containers.length, results];
+}
+return [null, 0, []];
+"""
+
+# Runs in the page: the body's rendered text, one line per text block.
+# Lines are joined with ' | ' rather than whitespace so the name patterns
+# (whose runs allow \s) still stop at element boundaries, as tags did when
+# matching against the page source
+_VISIBLE_TEXT_SCRIPT = """
+if (!document.body) return '';
+return document.body.innerText.split('\\n')
+    .map(line => line.trim())
+    .filter(line => line)
+    .join(' | ');
+"""
+
+def _any_substring(words):
+    """One compiled pattern that finds any of `words` as a substring"""
+    return re.compile('|'.join(map(re.escape, words)))
+
+# Vocabularies for validating extracted education/experience (lowercase
+# substrings)
+_FORM_TEXT = (
+    'password', 'must have', 'least', 'character', 'number', 'letter',
+    'uppercase', 'lowercase', 'special', 'symbol', 'validation',
+    'error', 'invalid', 'required', 'field', 'form', 'submit',
+    'login', 'signup', 'register', 'account', 'profile', 'settings'
+)
+_INVALID_EDUCATION_TEXT = _any_substring(_FORM_TEXT)
+_INVALID_EXPERIENCE_TEXT = _any_substring(
+    _FORM_TEXT + ('button', 'click', 'save', 'cancel', 'delete', 'edit')
+)
+_GENERIC_DEGREES = frozenset(('degree', 'diploma', 'certificate'))
+_DEGREE_KEYWORD = _any_substring((
+    'bachelor', 'master', 'phd', 'doctorate', 'mba', 'ms', 'ma', 'bs', 'ba',
+    'science', 'engineering', 'arts', 'business', 'computer', 'technology'
+))
+_JOB_KEYWORD = _any_substring((
+    'engineer', 'developer', 'scientist', 'architect', 'manager',
+    'analyst', 'specialist', 'consultant', 'lead', 'senior',
+    'principal', 'director', 'vp', 'head', 'chief', 'officer'
+))
+
+def _first_matches(pattern, text, limit):
+    """
+    pattern.findall(text)[:limit], but stops scanning the (page-sized) text
+    once `limit` matches are found instead of collecting every match
+    """
+    matches = itertools.islice(pattern.finditer(text), limit)
+    if pattern.groups > 1:
+        return [match.groups(default='') for match in matches]
+    return [match.group(pattern.groups) for match in matches]
+
+def _first_text(texts):
+    """First non-empty text, as the per-selector fallback loops used to pick"""
+    return next((text for text in texts if text), '')
+
+def _chrome_options():
+    """Fresh Chrome options for a scraping browser"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # Run in background
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={Config.USER_AGENT}")
+    
+    # Add additional options to avoid detection
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # Only page text is parsed, so skip downloading images, stylesheets and
+    # fonts, and hand control back once the DOM is ready (JS stays enabled:
+    # Google renders results with it)
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2
+    })
+    chrome_options.page_load_strategy = 'eager'
+    return chrome_options
+
+@functools.lru_cache(maxsize=None)
+def _resolve_driver_path():
+    """
+    Locate (downloading if needed) ChromeDriver through webdriver-manager,
+    once per process; a failure is not cached, so the next driver retries
+    """
+    # Get the ChromeDriver path and fix it if needed
+    driver_path = ChromeDriverManager().install()
+    
+    # Fix the path if it points to a documentation file
+    if "THIRD_PARTY_NOTICES" in driver_path:
+        # Navigate to the parent directory and find chromedriver.exe
+        parent_dir = os.path.dirname(driver_path)
+        chromedriver_exe = os.path.join(parent_dir, "chromedriver.exe")
+        if os.path.exists(chromedriver_exe):
+            driver_path = chromedriver_exe
+            print(f"   Fixed ChromeDriver path: {driver_path}")
+        else:
+            # Try to find chromedriver.exe in the directory
+            for file in os.listdir(parent_dir):
+                if file == "chromedriver.exe":
+                    driver_path = os.path.join(parent_dir, file)
+                    print(f"   Found ChromeDriver: {driver_path}")
+                    break
+    return driver_path
+
+# Request URL patterns the browser never fetches: media, stylesheets and fonts
+# by extension, whatever host serves them. The content-setting prefs above
+# stop most of these from rendering; blocking them at the network layer also
+# stops them from being downloaded at all
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif', '*.svg', '*.ico',
+    '*.css', '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm'
+]
+
+def _block_heavy_resources(driver):
+    """Abort requests matching BLOCKED_URL_PATTERNS via the DevTools protocol"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        # Only an optimization: browse unblocked rather than fail setup
+        print(f"   Could not block heavy resources: {e}")
+
+def setup_driver():
+    """
+    Start a Chrome WebDriver, with webdriver-manager for automatic ChromeDriver
+    management. Returns None if Chrome cannot be started.
+    """
+    try:
+        print("🔧 Setting up Chrome WebDriver...")
+        driver_path = _resolve_driver_path()
         
-        # Add additional options to avoid detection
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Reuse one HTTP connection to chromedriver for every command rather
+        # than reconnecting per find_element/get_attribute call
+        driver = webdriver.Chrome(
+            service=Service(driver_path),
+            options=_chrome_options(),
+            keep_alive=True
+        )
         
+        # Execute script to remove webdriver property
+        if driver:
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            _block_heavy_resources(driver)
+            print("✅ Chrome WebDriver setup complete!")
+        return driver
+    except Exception as e:
+        print(f"❌ Error setting up Chrome driver: {e}")
+        print("Please ensure Chrome browser is installed")
+        return None
+
+def _driver_alive(driver):
+    """Whether the driver's browser session still answers commands"""
+    try:
+        driver.current_window_handle
+        return True
+    except Exception:
+        return False
+
+class BrowserPool:
+    """
+    Chrome drivers shared by every LinkedInSearcher. Drivers are started on
+    demand, up to `size`, and handed out one caller at a time; a started
+    browser is reused for the life of the process instead of per searcher.
+    """
+
+    def __init__(self, size, factory=setup_driver):
+        self.size = size
+        self._factory = factory
+        self._idle = queue.LifoQueue()  # most recently used first: warmest browser
+        self._drivers = []  # started and not discarded; only these are re-queued
+        self._started = 0  # drivers started or starting
+        self._lock = threading.Lock()
+        self._unavailable = False
+        self._closed = False
+
+    @contextmanager
+    def acquire(self):
+        """Check out a driver (None if Chrome is unavailable) for the block"""
+        driver = self._checkout()
         try:
-            # Use webdriver-manager to automatically download and manage ChromeDriver
-            print("🔧 Setting up Chrome WebDriver...")
-            
-            # Get the ChromeDriver path and fix it if needed
-            driver_path = ChromeDriverManager().install()
-            
-            # Fix the path if it points to a documentation file
-            if "THIRD_PARTY_NOTICES" in driver_path:
-                import os
-                # Navigate to the parent directory and find chromedriver.exe
-                parent_dir = os.path.dirname(driver_path)
-                chromedriver_exe = os.path.join(parent_dir, "chromedriver.exe")
-                if os.path.exists(chromedriver_exe):
-                    driver_path = chromedriver_exe
-                    print(f"   Fixed ChromeDriver path: {driver_path}")
-                else:
-                    # Try to find chromedriver.exe in the directory
-                    for file in os.listdir(parent_dir):
-                        if file == "chromedriver.exe":
-                            driver_path = os.path.join(parent_dir, file)
-                            print(f"   Found ChromeDriver: {driver_path}")
-                            break
-            
-            self.driver = webdriver.Chrome(
-                service=Service(driver_path),
-                options=chrome_options
-            )
-            
-            # Execute script to remove webdriver property
-            if self.driver:
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                print("✅ Chrome WebDriver setup complete!")
-        except Exception as e:
-            print(f"❌ Error setting up Chrome driver: {e}")
-            print("Please ensure Chrome browser is installed")
-            self.driver = None
+            yield driver
+        except WebDriverException:
+            # A crashed or disconnected browser must not be handed out again;
+            # timeouts and missing elements leave a live session behind
+            if driver is not None and not _driver_alive(driver):
+                self.discard(driver)
+            raise
+        finally:
+            if driver is not None:
+                self._release(driver)
 
-    def search_linkedin_profiles(self, job_description, max_results=20):
+    def _checkout(self):
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                if self._closed:
+                    return None
+                start_new = not self._unavailable and self._started < self.size
+                if start_new:
+                    self._started += 1
+                elif not self._started:
+                    return None
+            if start_new:
+                driver = self._factory()
+                with self._lock:
+                    if driver is None:
+                        # Chrome can't be started; don't keep retrying
+                        self._started -= 1
+                        self._unavailable = True
+                    else:
+                        self._drivers.append(driver)
+                return driver
+            # Pool is full: wait for a driver to come back (or a slot to
+            # free up when one is discarded)
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                pass
+
+    def _release(self, driver):
+        """Return a checked-out driver, or quit it if it was discarded or the pool closed"""
+        with self._lock:
+            keep = not self._closed and driver in self._drivers
+        if keep:
+            self._idle.put(driver)
+        else:
+            self._quit(driver)
+
+    def discard(self, driver):
         """
-        Search for LinkedIn profiles using Selenium-based Google X-Ray search.
+        Drop a driver whose browser died: it is quit on release rather than
+        re-queued, and its slot can start a replacement
         """
-        if not self.driver:
-            print("❌ Chrome driver not available. Cannot perform search.")
-            return []
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self._started -= 1
 
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """
+        Quit every driver the pool started and stop handing out drivers;
+        any still checked out are quit, not re-queued, when released
+        """
+        with self._lock:
+            self._closed = True
+            drivers, self._drivers = self._drivers, []
+            self._started = 0
+        for driver in drivers:
+            self._quit(driver)
+
+
+_browser_pool = BrowserPool(Config.BROWSER_POOL_SIZE)
+atexit.register(_browser_pool.close)
+
+class LinkedInSearcher:
+    def __init__(self):
+        # Browsers come from the shared pool, and only when something needs
+        # one: profile pages, or searching without a search API key. While
+        # checked out, the driver is self.driver for the checking-out thread
+        # only, so threads sharing a searcher each drive their own browser.
+        self._local = threading.local()
+        # Keep-alive session for the search API
+        self.session = requests.Session()
+
+    @property
+    def driver(self):
+        return getattr(self._local, 'driver', None)
+
+    @driver.setter
+    def driver(self, driver):
+        self._local.driver = driver
+
+    @contextmanager
+    def _checkout_driver(self):
+        """Bind a pooled driver to self.driver (None if Chrome is unavailable) for the block"""
+        with _browser_pool.acquire() as driver:
+            self.driver = driver
+            try:
+                yield driver
+            finally:
+                self.driver = None
+                self._local.page_text = None
+
+    def _drop_dead_driver(self):
+        """After a failed page load: keep a crashed browser out of the pool"""
+        if self.driver is not None and not _driver_alive(self.driver):
+            _browser_pool.discard(self.driver)
+
+    def search_linkedin_profiles(self, job_description, max_results=20):
+        """
+        Search for LinkedIn profiles using Google X-Ray search, through the
+        search API when configured and Selenium otherwise.
+        """
         # Extract X-Ray search query
-        xray_query = self._build_xray_query(job_description)
+        xray_query = self.build_xray_query(job_description)
         print(f"🔍 Google X-Ray query: {xray_query}")
         
-        candidates = self._selenium_google_xray_search(xray_query, max_results)
+        if Config.SERPER_API_KEY:
+            candidates = self._google_xray_search_api(xray_query, max_results)
+        else:
+            with self._checkout_driver() as driver:
+                if not driver:
+                    print("❌ Chrome driver not available. Cannot perform search.")
+                    return []
+                candidates = self._selenium_google_xray_search(xray_query, max_results)
         print(f"   Total unique candidates found: {len(candidates)}")
         return candidates
 
-    def _build_xray_query(self, job_description):
+    async def search_many(self, job_descriptions, max_results=20, concurrency=8):
+        """
+        Run the searches for several job descriptions concurrently, at most
+        `concurrency` at a time. Returns one candidate list per description,
+        in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_event_loop()
+        
+        async def search_one(index, job_description):
+            async with semaphore:
+                candidates = await loop.run_in_executor(
+                    None, self.search_linkedin_profiles, job_description, max_results
+                )
+            return index, candidates
+        
+        results = [None] * len(job_descriptions)
+        for completed in asyncio.as_completed(
+            [search_one(i, job_description) for i, job_description in enumerate(job_descriptions)]
+        ):
+            index, candidates = await completed
+            results[index] = candidates
+        return results
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def build_xray_query(job_description):
         """
         Build a Google X-Ray search query from the job description.
         Format: site:linkedin.com/in/ AND ("job title" OR "skills") AND ("location" OR "company")
         """
-        job_title = self._extract_job_title(job_description)
-        skills = self._extract_skills(job_description)
-        location = self._extract_location(job_description)
-        company = self._extract_company(job_description)
+        job_title = LinkedInSearcher._extract_job_title(job_description)
+        skills = LinkedInSearcher._extract_skills(job_description)
+        location = LinkedInSearcher._extract_location(job_description)
+        company = LinkedInSearcher._extract_company(job_description)
 
         # Build the query
         query = 'site:linkedin.com/in/'
@@ -112,6 +533,55 @@ class LinkedInSearcher:
             query += f' AND ({" OR ".join(and_terms)})'
         return query
 
+    def _google_xray_search_api(self, query, max_results=10):
+        """
+        Perform Google X-Ray search through the Serper JSON API: one HTTP
+        round-trip instead of rendering the results page in a browser
+        """
+        try:
+            response = self.session.post(
+                Config.SERPER_SEARCH_URL,
+                json={'q': query, 'num': max_results},
+                headers={'X-API-KEY': Config.SERPER_API_KEY},
+                timeout=10
+            )
+            response.raise_for_status()
+            results = response.json().get('organic', [])
+        except Exception as e:
+            print(f"   Error performing Google X-Ray search API request: {e}")
+            return []
+        
+        rows = (
+            (result.get('link', ''), result.get('title') or "LinkedIn Profile", result.get('snippet', ''))
+            for result in results[:max_results]
+            if 'linkedin.com/in/' in result.get('link', '')
+        )
+        return list(self._deduplicate_candidates(self._candidates_from_results(rows)))
+
+    def _candidates_from_results(self, rows):
+        """Yield a candidate per (linkedin_url, title, snippet) row that has a profile ID"""
+        for linkedin_url, title, snippet in rows:
+            candidate = self._candidate_from_result(linkedin_url, title, snippet)
+            if candidate:
+                print(f"   Found candidate: {candidate['name']} - {candidate['headline']}")
+                yield candidate
+
+    def _candidate_from_result(self, linkedin_url, title, snippet):
+        """Build a candidate from one search result, or None without a profile ID"""
+        profile_id = self._extract_linkedin_profile_id(linkedin_url)
+        if not profile_id:
+            return None
+        return {
+            'name': self._extract_name_from_title(title),
+            'linkedin_url': f"https://www.linkedin.com/in/{profile_id}",
+            'headline': self._extract_headline_from_snippet(snippet),
+            'current_company': self._extract_company_from_snippet(snippet),
+            'location': self._extract_location_from_snippet(snippet),
+            'education': [],
+            'experience': [],
+            'skills': []
+        }
+
     def _selenium_google_xray_search(self, query, max_results=10):
         """
         Perform Google X-Ray search using Selenium
@@ -125,14 +595,11 @@ class LinkedInSearcher:
             print(f"   Navigating to: {search_url}")
             
             self.driver.get(search_url)
-            time.sleep(3)  # Wait for page to load
             
             # Wait for search results to appear
             wait = WebDriverWait(self.driver, 10)
             wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.g, div[data-sokoban-container], div.tF2Cxc, div.yuRUbf")))
             
-            candidates = []
-            
             # Find all search result containers
             search_selectors = [
                 "div.g",
@@ -142,165 +609,69 @@ class LinkedInSearcher:
                 "div.rc"
             ]
             
-            search_results = []
-            for selector in search_selectors:
-                try:
-                    results = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if results:
-                        search_results = results
-                        print(f"   Found {len(results)} results using selector: {selector}")
-                        break
-                except Exception as e:
-                    continue
+            snippet_selectors = [
+                "div.VwiC3b",
+                "div.s3v9rd", 
+                "span.st",
+                "div.s",
+                "div.rc div.s div.st"
+            ]
             
-            if not search_results:
+            # Read every result's link, title and snippet in one round-trip
+            selector, result_count, results = self.driver.execute_script(
+                _SEARCH_RESULTS_SCRIPT, search_selectors, max_results, snippet_selectors
+            )
+            if not result_count:
                 print("   No search results found with any selector")
                 return []
+            print(f"   Found {result_count} results using selector: {selector}")
             
-            # Process each search result
-            for result in search_results[:max_results]:
-                try:
-                    # Find the link element
-                    link_element = None
-                    link_selectors = ["a", "h3 a", "h2 a"]
-                    
-                    for selector in link_selectors:
-                        try:
-                            links = result.find_elements(By.CSS_SELECTOR, selector)
-                            for link in links:
-                                href = link.get_attribute('href')
-                                if href and 'linkedin.com/in/' in href:
-                                    link_element = link
-                                    break
-                            if link_element:
-                                break
-                        except:
-                            continue
-                    
-                    if not link_element:
-                        continue
-                    
-                    # Extract LinkedIn URL
-                    linkedin_url = link_element.get_attribute('href')
-                    if not linkedin_url or 'linkedin.com/in/' not in linkedin_url:
-                        continue
-                    
-                    # Extract title
-                    title = link_element.text.strip()
-                    if not title:
-                        # Try to get title from parent elements
-                        try:
-                            title_element = result.find_element(By.CSS_SELECTOR, "h3, h2")
-                            title = title_element.text.strip()
-                        except:
-                            title = "LinkedIn Profile"
-                    
-                    # Extract snippet
-                    snippet = ""
-                    snippet_selectors = [
-                        "div.VwiC3b",
-                        "div.s3v9rd", 
-                        "span.st",
-                        "div.s",
-                        "div.rc div.s div.st"
-                    ]
-                    
-                    for selector in snippet_selectors:
-                        try:
-                            snippet_element = result.find_element(By.CSS_SELECTOR, selector)
-                            snippet = snippet_element.text.strip()
-                            if snippet:
-                                break
-                        except:
-                            continue
-                    
-                    # Extract profile ID
-                    profile_id = self._extract_linkedin_profile_id(linkedin_url)
-                    if profile_id:
-                        candidate = {
-                            'name': self._extract_name_from_title(title),
-                            'linkedin_url': f"https://www.linkedin.com/in/{profile_id}",
-                            'headline': self._extract_headline_from_snippet(snippet),
-                            'current_company': self._extract_company_from_snippet(snippet),
-                            'location': self._extract_location_from_snippet(snippet),
-                            'education': [],
-                            'experience': [],
-                            'skills': []
-                        }
-                        candidates.append(candidate)
-                        print(f"   Found candidate: {candidate['name']} - {candidate['headline']}")
-                
-                except Exception as e:
-                    print(f"   Error parsing search result: {e}")
-                    continue
-            
-            return self._deduplicate_candidates(candidates)
+            rows = ((result['href'], result['title'], result['snippet']) for result in results)
+            return list(self._deduplicate_candidates(self._candidates_from_results(rows)))
             
         except TimeoutException:
             print("   Timeout waiting for search results")
             return []
         except Exception as e:
             print(f"   Error performing Selenium Google X-Ray search: {e}")
+            self._drop_dead_driver()
             return []
 
-    def _extract_job_title(self, job_description):
-        titles = [
-            'machine learning engineer', 'ml engineer', 'ai engineer', 'research engineer',
-            'software engineer', 'backend engineer', 'frontend engineer', 'full stack engineer',
-            'data scientist', 'devops engineer', 'product manager', 'senior engineer',
-            'lead engineer', 'principal engineer', 'research scientist', 'applied scientist'
-        ]
+    @staticmethod
+    def _extract_job_title(job_description):
         job_desc_lower = job_description.lower()
-        for title in titles:
-            if title in job_desc_lower:
-                return title
-        return ''
+        return next((title for title in JOB_TITLES if title in job_desc_lower), '')
 
-    def _extract_skills(self, job_description):
-        skills = [
-            'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
-            'machine learning', 'ai', 'ml', 'data science', 'backend', 'frontend', 'full stack',
-            'pytorch', 'tensorflow', 'llm', 'neural networks', 'deep learning', 'nlp',
-            'computer vision', 'reinforcement learning', 'statistics', 'sql', 'nosql'
-        ]
+    @staticmethod
+    def _extract_skills(job_description):
         job_desc_lower = job_description.lower()
-        found = [skill for skill in skills if skill in job_desc_lower]
-        return found
-
-    def _extract_location(self, job_description):
-        location_patterns = [
-            r'(?:in|at|based in|located in)\s+([A-Za-z\s,]+?)(?:\s+and|\s+we|\s+is|\s+looking)',
-            r'([A-Za-z\s,]+?),\s*[A-Z]{2}(?:\s+and|\s+we|\s+is|\s+looking)',
-            r'remote\s+(?:from\s+)?([A-Za-z\s,]+)',
-            r'([A-Za-z\s,]+?)\s+area'
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, job_description, re.IGNORECASE)
+        return [skill for skill in JOB_SKILLS if skill in job_desc_lower]
+
+    @staticmethod
+    def _extract_location(job_description):
+        for pattern in _LOCATION_PATTERNS:
+            match = pattern.search(job_description)
             if match:
                 location = match.group(1).strip()
-                location = re.sub(r'\s+', ' ', location).strip()
+                location = _WHITESPACE_RUN.sub(' ', location).strip()
                 if len(location) > 2 and len(location) < 30:
                     return location
         return ''
 
-    def _extract_company(self, job_description):
-        company_patterns = [
-            r'at\s+([A-Z][A-Za-z\s&]+?)(?:\s+is|\s+in|\s+seeks|\s+looking|\s+we)',
-            r'([A-Z][A-Za-z\s&]+?)\s+is\s+looking',
-            r'([A-Z][A-Za-z\s&]+?)\s+seeks',
-            r'join\s+([A-Z][A-Za-z\s&]+?)',
-            r'work\s+at\s+([A-Z][A-Za-z\s&]+?)'
-        ]
-        for pattern in company_patterns:
-            match = re.search(pattern, job_description, re.IGNORECASE)
+    @staticmethod
+    def _extract_company(job_description):
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(job_description)
             if match:
                 company = match.group(1).strip()
-                company = re.sub(r'\s+', ' ', company).strip()
+                company = _WHITESPACE_RUN.sub(' ', company).strip()
                 if len(company) > 2 and len(company) < 50:
                     return company
         return ''
 
-    def _extract_linkedin_profile_id(self, url):
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _extract_linkedin_profile_id(url):
         try:
             if '/in/' in url:
                 profile_part = url.split('/in/')[1]
@@ -310,7 +681,9 @@ class LinkedInSearcher:
             pass
         return None
 
-    def _extract_name_from_title(self, title):
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _extract_name_from_title(title):
         suffixes = [' | LinkedIn', ' - LinkedIn', ' (@', ' •']
         name = title
         for suffix in suffixes:
@@ -319,50 +692,37 @@ class LinkedInSearcher:
         return name.strip()
 
     def _extract_headline_from_snippet(self, snippet):
-        patterns = [
-            r'([^•]+) at ([^•]+)',
-            r'([^•]+) - ([^•]+)',
-            r'([^•]+) \| ([^•]+)'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, snippet)
+        for pattern in _SNIPPET_HEADLINE_PATTERNS:
+            match = pattern.search(snippet)
             if match:
                 return f"{match.group(1).strip()} at {match.group(2).strip()}"
         return snippet[:100] if snippet else ""
 
     def _extract_company_from_snippet(self, snippet):
-        patterns = [
-            r'at ([^•\n]+)',
-            r'- ([^•\n]+)',
-            r'\| ([^•\n]+)'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, snippet)
+        for pattern in _SNIPPET_COMPANY_PATTERNS:
+            match = pattern.search(snippet)
             if match:
                 company = match.group(1).strip()
-                company = re.sub(r'\d+', '', company).strip()
+                company = _DIGITS.sub('', company).strip()
                 return company
         return ""
 
     def _extract_location_from_snippet(self, snippet):
-        location_patterns = [
-            r'([A-Za-z\s]+), ([A-Z]{2})',
-            r'([A-Za-z\s]+), ([A-Za-z\s]+)',
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, snippet)
+        for pattern in _SNIPPET_LOCATION_PATTERNS:
+            match = pattern.search(snippet)
             if match:
                 return f"{match.group(1).strip()}, {match.group(2).strip()}"
         return ""
 
     def _deduplicate_candidates(self, candidates):
+        # Lazily yields the first occurrence of each profile; URLs differing
+        # only in case or a trailing slash are the same profile
         seen_urls = set()
-        unique_candidates = []
         for candidate in candidates:
-            if candidate['linkedin_url'] not in seen_urls:
-                seen_urls.add(candidate['linkedin_url'])
-                unique_candidates.append(candidate)
-        return unique_candidates
+            url = candidate['linkedin_url'].rstrip('/').lower()
+            if url not in seen_urls:
+                seen_urls.add(url)
+                yield candidate
 
     def get_profile_details(self, linkedin_url):
         """
@@ -370,17 +730,52 @@ class LinkedInSearcher:
         Note: This is a simplified version that extracts from search snippets
         For full profile scraping, you would need to implement actual LinkedIn profile parsing
         """
-        if not self.driver:
-            return {
-                'education': [],
-                'experience': [],
-                'skills': []
-            }
+        with self._checkout_driver() as driver:
+            if not driver:
+                return {
+                    'education': [],
+                    'experience': [],
+                    'skills': []
+                }
+            return self._extract_profile_details(linkedin_url)
+
+    async def get_profile_details_many(self, linkedin_urls, concurrency=Config.BROWSER_POOL_SIZE):
+        """
+        Fetch several profiles concurrently, at most `concurrency` at a time
+        (each holds a pooled browser while it runs). Returns one details dict
+        per URL, in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_event_loop()
+        
+        async def fetch_one(index, linkedin_url):
+            async with semaphore:
+                details = await loop.run_in_executor(
+                    None, self.get_profile_details, linkedin_url
+                )
+            return index, details
         
+        results = [None] * len(linkedin_urls)
+        for completed in asyncio.as_completed(
+            [fetch_one(i, linkedin_url) for i, linkedin_url in enumerate(linkedin_urls)]
+        ):
+            index, details = await completed
+            results[index] = details
+        return results
+
+    def _extract_profile_details(self, linkedin_url):
+        """get_profile_details with a driver checked out"""
         try:
             # Navigate to the profile
             self.driver.get(linkedin_url)
-            time.sleep(3)
+            self._local.page_text = None  # new page: the old source is stale
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "section, main"))
+                )
+            except TimeoutException:
+                # Extract whatever did render; the fallbacks below handle gaps
+                pass
             
             # Extract education
             education = self._extract_education_from_profile()
@@ -417,6 +812,7 @@ class LinkedInSearcher:
             
         except Exception as e:
             print(f"   Error extracting profile details: {e}")
+            self._drop_dead_driver()
             # Return empty arrays instead of trying fallback when profile access fails
             return {
                 'education': [],
@@ -450,6 +846,41 @@ class LinkedInSearcher:
         
         return False
 
+    def _page_text(self):
+        """
+        The current page's visible text, fetched once per page load and
+        shared by the text fallbacks. Much smaller than page_source, and
+        free of markup, scripts and styles for the patterns to misfire on
+        """
+        page_text = getattr(self._local, 'page_text', None)
+        if page_text is None:
+            page_text = self.driver.execute_script(_VISIBLE_TEXT_SCRIPT) or ''
+            page_text = self._local.page_text = page_text.translate(_UNICODE_SPACES)
+            self._local.page_lower = None
+        return page_text
+
+    def _page_text_lower(self):
+        """_page_text() lowercased, also computed once per page load"""
+        page_text = self._page_text()
+        page_lower = getattr(self._local, 'page_lower', None)
+        if page_lower is None:
+            page_lower = self._local.page_lower = page_text.lower()
+        return page_lower
+
+    def _query_profile_sections(self, container_selectors, limit, field_selectors):
+        """
+        Read profile fields in a single execute_script round-trip.
+        For each container selector, returns up to `limit` matching elements,
+        each as one list per field of the texts its selectors matched, in
+        selector order.
+        """
+        return self.driver.execute_script(
+            _PROFILE_SECTIONS_SCRIPT,
+            list(container_selectors),
+            limit,
+            [list(selectors) for selectors in field_selectors]
+        )
+
     def _extract_education_from_profile(self):
         """
         Extract education information from profile
@@ -471,77 +902,44 @@ class LinkedInSearcher:
                 ".education"
             ]
             
-            for selector in education_selectors:
-                try:
-                    education_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if education_elements:
-                        print(f"   Found education section with selector: {selector}")
-                        for element in education_elements[:3]:  # Limit to 3 most recent
-                            try:
-                                # Try multiple selectors for school name
-                                school_selectors = [
-                                    "h3", ".school-name", ".institution-name", 
-                                    ".pv-entity__school-name", ".education__school-name",
-                                    ".pv-entity__degree-name", ".degree-name"
-                                ]
-                                school = ""
-                                for school_selector in school_selectors:
-                                    try:
-                                        school_element = element.find_element(By.CSS_SELECTOR, school_selector)
-                                        school = school_element.text.strip()
-                                        if school:
-                                            break
-                                    except:
-                                        continue
-                                
-                                # Try multiple selectors for degree
-                                degree_selectors = [
-                                    ".degree-name", ".field-of-study", ".pv-entity__degree-name",
-                                    ".pv-entity__field-of-study", ".education__degree-name"
-                                ]
-                                degree = ""
-                                for degree_selector in degree_selectors:
-                                    try:
-                                        degree_element = element.find_element(By.CSS_SELECTOR, degree_selector)
-                                        degree = degree_element.text.strip()
-                                        if degree:
-                                            break
-                                    except:
-                                        continue
-                                
-                                if school or degree:
-                                    education.append({
-                                        'school': school,
-                                        'degree': degree,
-                                        'duration': ''
-                                    })
-                                    print(f"   Extracted education: {degree} from {school}")
-                            except Exception as e:
-                                print(f"   Error extracting individual education item: {e}")
-                                continue
-                        if education:
-                            break
-                except Exception as e:
-                    print(f"   Error with education selector {selector}: {e}")
-                    continue
+            school_selectors = [
+                "h3", ".school-name", ".institution-name", 
+                ".pv-entity__school-name", ".education__school-name",
+                ".pv-entity__degree-name", ".degree-name"
+            ]
+            degree_selectors = [
+                ".degree-name", ".field-of-study", ".pv-entity__degree-name",
+                ".pv-entity__field-of-study", ".education__degree-name"
+            ]
+            
+            # Limit to 3 most recent
+            sections = self._query_profile_sections(
+                education_selectors, 3, (school_selectors, degree_selectors)
+            )
+            for selector, items in zip(education_selectors, sections):
+                if items:
+                    print(f"   Found education section with selector: {selector}")
+                    for school_texts, degree_texts in items:
+                        school = _first_text(school_texts)
+                        degree = _first_text(degree_texts)
+                        if school or degree:
+                            education.append({
+                                'school': school,
+                                'degree': degree,
+                                'duration': ''
+                            })
+                            print(f"   Extracted education: {degree} from {school}")
+                    if education:
+                        break
             
             # If no structured education found, try to extract from page text
             if not education and self.driver:
                 print("   Attempting text-based education extraction...")
-                page_text = self.driver.page_source.lower()
-                education_keywords = ['university', 'college', 'institute', 'school', 'bachelor', 'master', 'phd', 'mba']
+                page_text = self._page_text()
                 
                 # Look for education patterns in the text
-                import re
-                education_patterns = [
-                    r'([A-Z][A-Za-z\s&]+(?:University|College|Institute|School))',
-                    r'(Bachelor|Master|PhD|MBA|BSc|MSc|MS|MA|BS|BA)\s+(?:of|in|from)\s+([A-Z][A-Za-z\s&]+)',
-                    r'([A-Z][A-Za-z\s&]+)\s+(?:University|College|Institute|School)'
-                ]
-                
-                for pattern in education_patterns:
-                    matches = re.findall(pattern, self.driver.page_source, re.IGNORECASE)
-                    for match in matches[:2]:  # Limit to 2 matches
+                for pattern in _TEXT_EDUCATION_PATTERNS:
+                    for match in _first_matches(pattern, page_text, 2):  # Limit to 2 matches
                         if isinstance(match, tuple):
                             degree, school = match
                         else:
@@ -582,76 +980,42 @@ class LinkedInSearcher:
                 ".experience"
             ]
             
-            for selector in experience_selectors:
-                try:
-                    experience_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if experience_elements:
-                        print(f"   Found experience section with selector: {selector}")
-                        for element in experience_elements[:5]:  # Limit to 5 most recent
-                            try:
-                                # Try multiple selectors for job title
-                                title_selectors = [
-                                    "h3", ".job-title", ".position-title", 
-                                    ".pv-entity__summary-info-v3__title",
-                                    ".experience__title", ".role-title"
-                                ]
-                                title = ""
-                                for title_selector in title_selectors:
-                                    try:
-                                        title_element = element.find_element(By.CSS_SELECTOR, title_selector)
-                                        title = title_element.text.strip()
-                                        if title:
-                                            break
-                                    except:
-                                        continue
-                                
-                                # Try multiple selectors for company name
-                                company_selectors = [
-                                    ".company-name", ".organization-name", 
-                                    ".pv-entity__secondary-title",
-                                    ".experience__company", ".company"
-                                ]
-                                company = ""
-                                for company_selector in company_selectors:
-                                    try:
-                                        company_element = element.find_element(By.CSS_SELECTOR, company_selector)
-                                        company = company_element.text.strip()
-                                        if company:
-                                            break
-                                    except:
-                                        continue
-                                
-                                # Try multiple selectors for duration
-                                duration_selectors = [
-                                    ".date-range", ".duration", ".pv-entity__date-range",
-                                    ".experience__duration", ".time-period"
-                                ]
-                                duration = ""
-                                for duration_selector in duration_selectors:
-                                    try:
-                                        duration_element = element.find_element(By.CSS_SELECTOR, duration_selector)
-                                        duration = duration_element.text.strip()
-                                        if duration:
-                                            break
-                                    except:
-                                        continue
-                                
-                                if title or company:
-                                    experience.append({
-                                        'title': title,
-                                        'company': company,
-                                        'duration': duration,
-                                        'description': ''
-                                    })
-                                    print(f"   Extracted experience: {title} at {company}")
-                            except Exception as e:
-                                print(f"   Error extracting individual experience item: {e}")
-                                continue
-                        if experience:
-                            break
-                except Exception as e:
-                    print(f"   Error with experience selector {selector}: {e}")
-                    continue
+            title_selectors = [
+                "h3", ".job-title", ".position-title", 
+                ".pv-entity__summary-info-v3__title",
+                ".experience__title", ".role-title"
+            ]
+            company_selectors = [
+                ".company-name", ".organization-name", 
+                ".pv-entity__secondary-title",
+                ".experience__company", ".company"
+            ]
+            duration_selectors = [
+                ".date-range", ".duration", ".pv-entity__date-range",
+                ".experience__duration", ".time-period"
+            ]
+            
+            # Limit to 5 most recent
+            sections = self._query_profile_sections(
+                experience_selectors, 5, (title_selectors, company_selectors, duration_selectors)
+            )
+            for selector, items in zip(experience_selectors, sections):
+                if items:
+                    print(f"   Found experience section with selector: {selector}")
+                    for title_texts, company_texts, duration_texts in items:
+                        title = _first_text(title_texts)
+                        company = _first_text(company_texts)
+                        duration = _first_text(duration_texts)
+                        if title or company:
+                            experience.append({
+                                'title': title,
+                                'company': company,
+                                'duration': duration,
+                                'description': ''
+                            })
+                            print(f"   Extracted experience: {title} at {company}")
+                    if experience:
+                        break
             
         except Exception as e:
             print(f"   Error extracting experience: {e}")
@@ -679,61 +1043,36 @@ class LinkedInSearcher:
                 ".skill"
             ]
             
-            for selector in skills_selectors:
-                try:
-                    skill_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if skill_elements:
-                        print(f"   Found skills section with selector: {selector}")
-                        for element in skill_elements[:10]:  # Limit to 10 skills
-                            try:
-                                # Try multiple selectors for skill names
-                                skill_selectors = [
-                                    ".skill-name", ".skill-title", ".pv-skill-category-entity__name",
-                                    ".endorsed-skill__name", ".skill__name", "span", "div"
-                                ]
-                                skill = ""
-                                for skill_selector in skill_selectors:
-                                    try:
-                                        skill_element = element.find_element(By.CSS_SELECTOR, skill_selector)
-                                        skill = skill_element.text.strip()
-                                        if skill and len(skill) > 2 and len(skill) < 50:
-                                            # Filter out common non-skill text
-                                            if skill.lower() not in ['endorsed', 'skill', 'skills', 'add skill', 'show more']:
-                                                break
-                                    except:
-                                        continue
-                                
-                                if skill and skill not in skills:
-                                    skills.append(skill)
-                                    print(f"   Extracted skill: {skill}")
-                            except Exception as e:
-                                print(f"   Error extracting individual skill: {e}")
-                                continue
-                        if skills:
-                            break
-                except Exception as e:
-                    print(f"   Error with skills selector {selector}: {e}")
-                    continue
+            skill_selectors = [
+                ".skill-name", ".skill-title", ".pv-skill-category-entity__name",
+                ".endorsed-skill__name", ".skill__name", "span", "div"
+            ]
+            
+            # Limit to 10 skills
+            sections = self._query_profile_sections(skills_selectors, 10, (skill_selectors,))
+            for selector, items in zip(skills_selectors, sections):
+                if items:
+                    print(f"   Found skills section with selector: {selector}")
+                    seen_skills = set()
+                    for (skill_texts,) in items:
+                        skill = ""
+                        for skill in skill_texts:
+                            if skill and len(skill) > 2 and len(skill) < 50:
+                                # Filter out common non-skill text
+                                if skill.lower() not in ['endorsed', 'skill', 'skills', 'add skill', 'show more']:
+                                    break
+                        
+                        if skill and skill not in seen_skills:
+                            seen_skills.add(skill)
+                            skills.append(skill)
+                            print(f"   Extracted skill: {skill}")
+                    if skills:
+                        break
             
             # If no structured skills found, try to extract from text
             if not skills and self.driver:
                 print("   Attempting text-based skills extraction...")
-                page_text = self.driver.page_source.lower()
-                tech_skills = [
-                    'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
-                    'machine learning', 'ai', 'ml', 'data science', 'backend', 'frontend', 'full stack',
-                    'sql', 'nosql', 'mongodb', 'postgresql', 'redis', 'elasticsearch', 'kafka',
-                    'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'git', 'jenkins',
-                    'terraform', 'ansible', 'microservices', 'api', 'rest', 'graphql', 'html', 'css',
-                    'typescript', 'angular', 'vue.js', 'express.js', 'django', 'flask', 'spring',
-                    'hibernate', 'junit', 'maven', 'gradle', 'npm', 'yarn', 'webpack', 'babel',
-                    'jest', 'cypress', 'selenium', 'jira', 'confluence', 'slack', 'zoom', 'figma',
-                    'sketch', 'adobe', 'photoshop', 'illustrator', 'invision', 'zeplin'
-                ]
-                
-                for skill in tech_skills:
-                    if skill in page_text:
-                        skills.append(skill.title())
+                skills = _find_tech_skills(self._page_text_lower())
                 
         except Exception as e:
             print(f"   Error extracting skills: {e}")
@@ -751,22 +1090,14 @@ class LinkedInSearcher:
         }
         
         try:
-            # Get the page source for text analysis
-            page_text = self.driver.page_source if self.driver else ""
+            # Get the page text for analysis
+            page_text = self._page_text() if self.driver else ""
+            page_lower = self._page_text_lower() if self.driver else ""
             
             # Extract education from text patterns
-            import re
-            education_patterns = [
-                r'([A-Z][A-Za-z\s&]+(?:University|College|Institute|School))',
-                r'(Bachelor|Master|PhD|MBA|BSc|MSc|MS|MA|BS|BA)\s+(?:of|in|from)\s+([A-Z][A-Za-z\s&]+)',
-                r'([A-Z][A-Za-z\s&]+)\s+(?:University|College|Institute|School)',
-                r'(MIT|Stanford|Harvard|Berkeley|CMU|Caltech|Princeton|Yale|Columbia|Cornell|UCLA|UCSD)',
-                r'(Bachelor|Master|PhD|MBA|BSc|MSc|MS|MA|BS|BA)\s+(?:degree|in|of)',
-            ]
-            
-            for pattern in education_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches[:2]:  # Limit to 2 matches
+            seen_schools = set()
+            for pattern in _FALLBACK_EDUCATION_PATTERNS:
+                for match in _first_matches(pattern, page_text, 2):  # Limit to 2 matches
                     if isinstance(match, tuple):
                         if len(match) == 2:
                             degree, school = match
@@ -786,8 +1117,8 @@ class LinkedInSearcher:
                     # Validate the extracted data
                     if self._is_valid_education_data(school.strip(), degree.strip()):
                         # Check if we already have this education entry
-                        existing = [e for e in fallback_data['education'] if e['school'] == school.strip()]
-                        if not existing:
+                        if school.strip() not in seen_schools:
+                            seen_schools.add(school.strip())
                             fallback_data['education'].append({
                                 'school': school.strip(),
                                 'degree': degree.strip(),
@@ -796,15 +1127,9 @@ class LinkedInSearcher:
                             print(f"   Fallback extracted education: {degree} from {school}")
             
             # Extract experience from text patterns
-            experience_patterns = [
-                r'([A-Z][A-Za-z\s&]+)\s+(?:at|@)\s+([A-Z][A-Za-z\s&]+)',
-                r'(Senior|Lead|Principal|Software|Data|ML|AI|Full Stack|Backend|Frontend)\s+(Engineer|Developer|Scientist|Architect|Manager)',
-                r'([A-Z][A-Za-z\s&]+)\s+(?:Engineer|Developer|Scientist|Architect|Manager)',
-            ]
-            
-            for pattern in experience_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches[:3]:  # Limit to 3 matches
+            seen_titles = set()
+            for pattern in _FALLBACK_EXPERIENCE_PATTERNS:
+                for match in _first_matches(pattern, page_text, 3):  # Limit to 3 matches
                     if isinstance(match, tuple):
                         if len(match) == 2:
                             title, company = match
@@ -817,8 +1142,8 @@ class LinkedInSearcher:
                     # Validate the extracted data
                     if self._is_valid_experience_data(title.strip(), company.strip()):
                         # Check if we already have this experience entry
-                        existing = [e for e in fallback_data['experience'] if e['title'] == title.strip()]
-                        if not existing:
+                        if title.strip() not in seen_titles:
+                            seen_titles.add(title.strip())
                             fallback_data['experience'].append({
                                 'title': title.strip(),
                                 'company': company.strip(),
@@ -828,23 +1153,7 @@ class LinkedInSearcher:
                             print(f"   Fallback extracted experience: {title} at {company}")
             
             # Extract skills from text
-            tech_skills = [
-                'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
-                'machine learning', 'ai', 'ml', 'data science', 'backend', 'frontend', 'full stack',
-                'sql', 'nosql', 'mongodb', 'postgresql', 'redis', 'elasticsearch', 'kafka',
-                'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'git', 'jenkins',
-                'terraform', 'ansible', 'microservices', 'api', 'rest', 'graphql', 'html', 'css',
-                'typescript', 'angular', 'vue.js', 'express.js', 'django', 'flask', 'spring',
-                'hibernate', 'junit', 'maven', 'gradle', 'npm', 'yarn', 'webpack', 'babel',
-                'jest', 'cypress', 'selenium', 'jira', 'confluence', 'slack', 'zoom', 'figma',
-                'sketch', 'adobe', 'photoshop', 'illustrator', 'invision', 'zeplin'
-            ]
-            
-            for skill in tech_skills:
-                if skill in page_text.lower():
-                    fallback_data['skills'].append(skill.title())
-            
-            fallback_data['skills'] = fallback_data['skills'][:10]  # Limit to 10 skills
+            fallback_data['skills'] = _find_tech_skills(page_lower)
             
         except Exception as e:
             print(f"   Error in fallback data extraction: {e}")
@@ -855,96 +1164,60 @@ class LinkedInSearcher:
         """
         Validate if extracted education data is legitimate
         """
-        # Filter out common invalid patterns
-        invalid_patterns = [
-            'password', 'must have', 'least', 'character', 'number', 'letter',
-            'uppercase', 'lowercase', 'special', 'symbol', 'validation',
-            'error', 'invalid', 'required', 'field', 'form', 'submit',
-            'login', 'signup', 'register', 'account', 'profile', 'settings'
-        ]
-        
-        school_lower = school.lower()
-        degree_lower = degree.lower()
-        
-        # Check for invalid patterns
-        for pattern in invalid_patterns:
-            if pattern in school_lower or pattern in degree_lower:
-                return False
-        
-        # Check for minimum length and meaningful content
+        # Cheapest checks first: most rejected entries fail on length or
+        # keywords before the form-text scan ever runs
         if len(school) < 3 or len(degree) < 3:
             return False
         
-        # Check if it looks like a real school name
-        if not any(char.isalpha() for char in school):
-            return False
+        degree_lower = degree.lower()
         
-        # Check if it looks like a real degree
-        if not any(char.isalpha() for char in degree):
+        # Check for more specific degree patterns (every keyword is
+        # alphabetic, so a match also proves the degree has letters)
+        if not _DEGREE_KEYWORD.search(degree_lower):
             return False
         
         # Filter out generic/meaningless data
-        if degree_lower in ['degree', 'diploma', 'certificate'] and len(school) < 5:
+        if degree_lower in _GENERIC_DEGREES and len(school) < 5:
             return False
         
-        # Check for more specific degree patterns
-        degree_keywords = [
-            'bachelor', 'master', 'phd', 'doctorate', 'mba', 'ms', 'ma', 'bs', 'ba',
-            'science', 'engineering', 'arts', 'business', 'computer', 'technology'
-        ]
-        
-        has_meaningful_degree = any(keyword in degree_lower for keyword in degree_keywords)
+        # Check if it looks like a real school name
+        if not any(char.isalpha() for char in school):
+            return False
         
-        return has_meaningful_degree
+        # Filter out common invalid patterns
+        return not (_INVALID_EDUCATION_TEXT.search(school.lower()) or
+                    _INVALID_EDUCATION_TEXT.search(degree_lower))
     
     def _is_valid_experience_data(self, title, company):
         """
         Validate if extracted experience data is legitimate
         """
-        # Filter out common invalid patterns
-        invalid_patterns = [
-            'password', 'must have', 'least', 'character', 'number', 'letter',
-            'uppercase', 'lowercase', 'special', 'symbol', 'validation',
-            'error', 'invalid', 'required', 'field', 'form', 'submit',
-            'login', 'signup', 'register', 'account', 'profile', 'settings',
-            'button', 'click', 'submit', 'save', 'cancel', 'delete', 'edit'
-        ]
-        
-        title_lower = title.lower()
-        company_lower = company.lower()
-        
-        # Check for invalid patterns
-        for pattern in invalid_patterns:
-            if pattern in title_lower or pattern in company_lower:
-                return False
-        
-        # Check for minimum length and meaningful content
+        # Cheapest checks first, as in _is_valid_education_data
         if len(title) < 3 or len(company) < 3:
             return False
         
-        # Check if it looks like a real job title
-        if not any(char.isalpha() for char in title):
+        title_lower = title.lower()
+        
+        # Check for common job title keywords (a match implies the title
+        # has letters)
+        if not _JOB_KEYWORD.search(title_lower):
             return False
         
         # Check if it looks like a real company name
         if not any(char.isalpha() for char in company):
             return False
         
-        # Check for common job title keywords
-        job_keywords = [
-            'engineer', 'developer', 'scientist', 'architect', 'manager',
-            'analyst', 'specialist', 'consultant', 'lead', 'senior',
-            'principal', 'director', 'vp', 'head', 'chief', 'officer'
-        ]
-        
-        has_job_keyword = any(keyword in title_lower for keyword in job_keywords)
-        
-        return has_job_keyword
+        # Filter out common invalid patterns
+        return not (_INVALID_EXPERIENCE_TEXT.search(title_lower) or
+                    _INVALID_EXPERIENCE_TEXT.search(company.lower()))
 
-    def __del__(self):
-        """Cleanup driver when object is destroyed"""
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass 
\ No newline at end of file
+    def close(self):
+        """Release the search session; browsers stay in the shared pool for reuse"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False 
\ No newline at end of file
@@ -4,17 +4,19 @@ Enhanced LinkedIn Sourcing Agent - Main Script
 Demonstrates the complete pipeline with multi-source data, caching, batch processing, and confidence scoring
 """
 
-from linkedin_agent import LinkedInSourcingAgent
-from pdf_processor import PDFProcessor
-from multi_source_collector import MultiSourceCollector
-from batch_processor import BatchProcessor, AsyncBatchProcessor, JobRequest, create_sample_jobs
-from smart_cache import SmartCache
-from confidence_scorer import ConfidenceScorer
+# Pipeline components (Selenium, numpy, PyPDF2, ...) are imported inside the
+# functions that use them, so usage errors and each mode load only what they need
+import atexit
+import concurrent.futures
+import hashlib
 import json
+import logging
+import logging.handlers
+import queue
 import sys
 import os
-import asyncio
 import time
+from config import Config
 
 def read_text_file(file_path):
     """
@@ -29,8 +31,33 @@ def read_text_file(file_path):
     except Exception as e:
         raise Exception(f"Error reading text file: {e}")
 
+_log_listener = None
+
+def configure_logging():
+    """
+    Print the agent's pipeline progress to stdout. Records go through a
+    queue to a listener thread, so concurrent enrichment tasks never block
+    on writing to the console. Only the first call installs the handler
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    agent_logger = logging.getLogger('linkedin_agent')
+    agent_logger.setLevel(logging.INFO)
+    agent_logger.propagate = False  # printed here, not again by root handlers
+    log_queue = queue.SimpleQueue()
+    agent_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(message)s'))
+    _log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 def enhanced_main():
     """Enhanced main function with all new features"""
+    # Also the installed console script's entry point, so set up here
+    configure_logging()
+    
     # Check if file path is provided as command line argument
     if len(sys.argv) < 2:
         print("Usage: python main.py <path_to_job_description.txt> [--batch] [--async] [--demo]")
@@ -56,56 +83,71 @@ def enhanced_main():
     print("\n=== Enhanced LinkedIn Sourcing Agent ===")
     print("Initializing components...")
     
-    agent = LinkedInSourcingAgent()
-    pdf_processor = PDFProcessor()
-    multi_source = MultiSourceCollector()
-    cache = SmartCache()
-    confidence_scorer = ConfidenceScorer()
-    
-    print("✅ All components initialized")
+    from linkedin_agent import LinkedInSourcingAgent
+    from pdf_processor import PDFProcessor
+    from multi_source_collector import MultiSourceCollector
+    from confidence_scorer import ConfidenceScorer
     
-    try:
-        # Process job description
-        if file_path.lower().endswith('.pdf'):
-            print("📄 Extracting job information from PDF...")
-            job_info = pdf_processor.process_job_pdf(file_path)
-        elif file_path.lower().endswith('.txt'):
-            print("📄 Reading job information from text file...")
-            job_text = read_text_file(file_path)
-            job_info = pdf_processor.parse_job_description(job_text)
-        else:
-            print("❌ Error: Unsupported file format. Please use .pdf or .txt files.")
-            sys.exit(1)
+    with LinkedInSourcingAgent() as agent:
+        pdf_processor = PDFProcessor()
+        multi_source = MultiSourceCollector()
+        cache = agent.smart_cache  # one cache (and in-memory layer) for the whole run
+        confidence_scorer = ConfidenceScorer()
         
-        # Display extracted information
-        pdf_processor.print_job_summary(job_info)
+        print("✅ All components initialized")
         
-        # Get user preferences
-        max_candidates = input("Max candidates to process (default 15): ").strip()
         try:
-            max_candidates = int(max_candidates)
-        except ValueError:
-            max_candidates = 15
-        
-        enable_multi_source = input("Enable multi-source data collection? (y/n, default y): ").strip().lower()
-        enable_multi_source = enable_multi_source != 'n'
-        
-        if batch_mode or async_mode:
-            run_batch_processing(job_info, max_candidates, async_mode, enable_multi_source)
-        else:
-            run_single_job(job_info, max_candidates, enable_multi_source, agent, multi_source, confidence_scorer)
-        
-    except FileNotFoundError:
-        print(f"❌ Error: File not found: {file_path}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
+            # Process job description
+            is_pdf = file_path.lower().endswith('.pdf')
+            if not is_pdf and not file_path.lower().endswith('.txt'):
+                print("❌ Error: Unsupported file format. Please use .pdf or .txt files.")
+                sys.exit(1)
+            
+            # Parsed job information is cached by file content, so re-runs on
+            # an unchanged file skip reading and parsing it
+            with open(file_path, 'rb') as file:
+                file_hash = hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+            job_info = cache.get_cached_parsed_job(file_hash)
+            if job_info:
+                print("📋 Using cached job information")
+            else:
+                if is_pdf:
+                    print("📄 Extracting job information from PDF...")
+                    job_info = pdf_processor.process_job_pdf(file_path)
+                else:
+                    print("📄 Reading job information from text file...")
+                    job_text = read_text_file(file_path)
+                    job_info = pdf_processor.parse_job_description(job_text)
+                cache.cache_parsed_job(file_hash, job_info)
+            
+            # Display extracted information
+            pdf_processor.print_job_summary(job_info)
+            
+            # Get user preferences
+            max_candidates = input("Max candidates to process (default 15): ").strip()
+            try:
+                max_candidates = int(max_candidates)
+            except ValueError:
+                max_candidates = 15
+            
+            enable_multi_source = input("Enable multi-source data collection? (y/n, default y): ").strip().lower()
+            enable_multi_source = enable_multi_source != 'n'
+            
+            if batch_mode or async_mode:
+                run_batch_processing(job_info, max_candidates, async_mode, enable_multi_source)
+            else:
+                run_single_job(job_info, max_candidates, enable_multi_source, agent, multi_source, confidence_scorer, cache)
+            
+        except FileNotFoundError:
+            print(f"❌ Error: File not found: {file_path}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
 
-def run_single_job(job_info, max_candidates, enable_multi_source, agent, multi_source, confidence_scorer):
+def run_single_job(job_info, max_candidates, enable_multi_source, agent, multi_source, confidence_scorer, cache):
     """Run a single job with enhanced features"""
     print("\n🚀 Processing job with enhanced features...")
     
     # Check cache first
-    cache = SmartCache()
     cached_result = cache.get_cached_job_analysis(job_info['job_description'])
     if cached_result:
         print("📋 Using cached job analysis")
@@ -134,18 +176,19 @@ def run_single_job(job_info, max_candidates, enable_multi_source, agent, multi_s
     # Enhance with multi-source data if enabled
     if enable_multi_source and result.get('top_candidates'):
         print("🔗 Enhancing candidates with multi-source data...")
-        enhanced_candidates = []
-        for candidate in result['top_candidates']:
-            enhanced = multi_source.enhance_candidate_data(candidate)
-            enhanced_candidates.append(enhanced)
-        result['top_candidates'] = enhanced_candidates
+        # Each enhancement is independent and mostly waiting on HTTP
+        with concurrent.futures.ThreadPoolExecutor(max_workers=Config.ENRICHMENT_CONCURRENCY) as executor:
+            result['top_candidates'] = list(
+                executor.map(multi_source.enhance_candidate_data, result['top_candidates'])
+            )
     
     # Calculate confidence scores
     if result.get('top_candidates'):
         print("📊 Calculating confidence scores...")
-        for candidate in result['top_candidates']:
-            confidence_metrics = confidence_scorer.calculate_comprehensive_confidence(candidate)
-            candidate['confidence_analysis'] = confidence_scorer.get_confidence_summary(confidence_metrics)
+        # CPU-bound, so scored as one vectorized batch rather than in threads
+        confidence_batch = confidence_scorer.calculate_batch(result['top_candidates'])
+        for i, candidate in enumerate(result['top_candidates']):
+            candidate['confidence_analysis'] = confidence_scorer.get_confidence_summary(confidence_batch[i])
     
     processing_time = time.time() - start_time
     print(f"⏱️ Total processing time: {processing_time:.2f} seconds")
@@ -161,12 +204,15 @@ def run_batch_processing(job_info, max_candidates, async_mode, enable_multi_sour
     print(f"\n🔄 Running batch processing ({'async' if async_mode else 'threaded'})...")
     
     if async_mode:
+        import asyncio
         asyncio.run(run_async_batch(job_info, max_candidates, enable_multi_source))
     else:
         run_threaded_batch(job_info, max_candidates, enable_multi_source)
 
 def run_threaded_batch(job_info, max_candidates, enable_multi_source):
     """Run threaded batch processing"""
+    from batch_processor import BatchProcessor, JobRequest, create_sample_jobs
+    
     # Create multiple job variations
     jobs = create_sample_jobs()
     jobs.append(JobRequest(
@@ -182,23 +228,26 @@ def run_threaded_batch(job_info, max_candidates, enable_multi_source):
     batch_processor = BatchProcessor(max_workers=3)
     batch_processor.start_workers()
     
-    # Submit all jobs
-    for job in jobs:
-        batch_processor.submit_job(job)
-    
-    print(f"📤 Submitted {len(jobs)} jobs to batch processor")
-    
-    # Wait for completion and collect results
-    batch_processor.wait_for_completion()
-    results = batch_processor.get_all_results()
-    
-    # Print batch results
-    print_batch_results(results)
-    
-    batch_processor.stop_workers()
+    try:
+        # Submit all jobs
+        for job in jobs:
+            batch_processor.submit_job(job)
+        
+        print(f"📤 Submitted {len(jobs)} jobs to batch processor")
+        
+        # Wait for completion and collect results
+        batch_processor.wait_for_completion()
+        results = batch_processor.get_all_results()
+        
+        # Print batch results
+        print_batch_results(results)
+    finally:
+        batch_processor.shutdown()
 
 async def run_async_batch(job_info, max_candidates, enable_multi_source):
     """Run async batch processing"""
+    from batch_processor import AsyncBatchProcessor, JobRequest, create_sample_jobs
+    
     # Create multiple job variations
     jobs = create_sample_jobs()
     jobs.append(JobRequest(
@@ -214,7 +263,10 @@ async def run_async_batch(job_info, max_candidates, enable_multi_source):
     async_processor = AsyncBatchProcessor(max_concurrent=3)
     
     # Process all jobs
-    results = await async_processor.process_jobs(jobs)
+    try:
+        results = await async_processor.process_jobs(jobs)
+    finally:
+        async_processor.shutdown()
     
     # Print batch results
     print_batch_results(results)
@@ -224,85 +276,91 @@ def run_demo():
     print("\n🎯 Enhanced LinkedIn Sourcing Agent - Demo Mode")
     print("="*60)
     
+    from linkedin_agent import LinkedInSourcingAgent
+    from multi_source_collector import MultiSourceCollector
+    from batch_processor import BatchProcessor, create_sample_jobs
+    from confidence_scorer import ConfidenceScorer
+    
     # Initialize components
-    agent = LinkedInSourcingAgent()
-    multi_source = MultiSourceCollector()
-    cache = SmartCache()
-    confidence_scorer = ConfidenceScorer()
-    
-    # Demo job
-    demo_job = {
-        'job_description': """
-        Senior Python Developer - AI Startup
+    with LinkedInSourcingAgent() as agent:
+        multi_source = MultiSourceCollector()
+        cache = agent.smart_cache  # one cache (and in-memory layer) for the whole run
+        confidence_scorer = ConfidenceScorer()
         
-        We're looking for a Senior Python Developer with:
-        - 5+ years of Python development experience
-        - Experience with Django/Flask frameworks
-        - Knowledge of machine learning libraries (TensorFlow/PyTorch)
-        - AWS cloud infrastructure experience
-        - Docker and Kubernetes familiarity
-        """,
-        'company_name': 'AI Startup',
-        'position_title': 'Senior Python Developer',
-        'location': 'San Francisco, CA'
-    }
-    
-    print("1️⃣ Testing basic LinkedIn sourcing...")
-    result = agent.process_job(
-        job_description=demo_job['job_description'],
-        company_name=demo_job['company_name'],
-        position_title=demo_job['position_title'],
-        location=demo_job['location'],
-        max_candidates=5
-    )
-    
-    print(f"   Found {len(result.get('candidates', []))} candidates")
-    
-    print("\n2️⃣ Testing multi-source data collection...")
-    if result.get('candidates'):
-        enhanced = multi_source.enhance_candidate_data(result['candidates'][0])
-        print(f"   Enhanced candidate: {enhanced.get('name', 'Unknown')}")
-        if enhanced.get('github_username'):
-            print(f"   GitHub: {enhanced['github_username']}")
-        if enhanced.get('twitter_username'):
-            print(f"   Twitter: {enhanced['twitter_username']}")
-        if enhanced.get('personal_website'):
-            print(f"   Website: {enhanced['personal_website']['url']}")
-    
-    print("\n3️⃣ Testing confidence scoring...")
-    # Use a simple job analysis structure
-    job_analysis = {
-        'required_skills': ['python', 'django', 'flask', 'machine learning', 'aws', 'docker'],
-        'job_description': demo_job['job_description'],
-        'company_name': demo_job['company_name'],
-        'position_title': demo_job['position_title']
-    }
-    print(f"   Job requirements analyzed: {len(job_analysis.get('required_skills', []))} skills identified")
-    
-    if result.get('candidates'):
-        confidence_metrics = confidence_scorer.calculate_comprehensive_confidence(result['candidates'][0])
-        confidence_summary = confidence_scorer.get_confidence_summary(confidence_metrics)
-        print(f"   Candidate confidence: {confidence_summary.get('overall_confidence', 0):.2f}/1.0")
-    
-    print("\n4️⃣ Testing caching...")
-    cache_stats = cache.get_cache_stats()
-    print(f"   Cache stats: {cache_stats.get('total_entries', 0)} entries")
-    
-    print("\n5️⃣ Testing batch processing...")
-    jobs = create_sample_jobs()[:2]  # Just 2 jobs for demo
-    batch_processor = BatchProcessor(max_workers=2)
-    batch_processor.start_workers()
-    
-    for job in jobs:
-        batch_processor.submit_job(job)
-    
-    batch_processor.wait_for_completion()
-    batch_results = batch_processor.get_all_results()
-    print(f"   Batch processed {len(batch_results)} jobs")
-    
-    batch_processor.stop_workers()
-    
-    print("\n✅ Demo completed successfully!")
+        # Demo job
+        demo_job = {
+            'job_description': """
+            Senior Python Developer - AI Startup
+            
+            We're looking for a Senior Python Developer with:
+            - 5+ years of Python development experience
+            - Experience with Django/Flask frameworks
+            - Knowledge of machine learning libraries (TensorFlow/PyTorch)
+            - AWS cloud infrastructure experience
+            - Docker and Kubernetes familiarity
+            """,
+            'company_name': 'AI Startup',
+            'position_title': 'Senior Python Developer',
+            'location': 'San Francisco, CA'
+        }
+        
+        print("1️⃣ Testing basic LinkedIn sourcing...")
+        result = agent.process_job(
+            job_description=demo_job['job_description'],
+            company_name=demo_job['company_name'],
+            position_title=demo_job['position_title'],
+            location=demo_job['location'],
+            max_candidates=5
+        )
+        
+        print(f"   Found {len(result.get('candidates', []))} candidates")
+        
+        print("\n2️⃣ Testing multi-source data collection...")
+        if result.get('candidates'):
+            enhanced = multi_source.enhance_candidate_data(result['candidates'][0])
+            print(f"   Enhanced candidate: {enhanced.get('name', 'Unknown')}")
+            if enhanced.get('github_username'):
+                print(f"   GitHub: {enhanced['github_username']}")
+            if enhanced.get('twitter_username'):
+                print(f"   Twitter: {enhanced['twitter_username']}")
+            if enhanced.get('personal_website'):
+                print(f"   Website: {enhanced['personal_website']['url']}")
+        
+        print("\n3️⃣ Testing confidence scoring...")
+        # Use a simple job analysis structure
+        job_analysis = {
+            'required_skills': ['python', 'django', 'flask', 'machine learning', 'aws', 'docker'],
+            'job_description': demo_job['job_description'],
+            'company_name': demo_job['company_name'],
+            'position_title': demo_job['position_title']
+        }
+        print(f"   Job requirements analyzed: {len(job_analysis.get('required_skills', []))} skills identified")
+        
+        if result.get('candidates'):
+            confidence_metrics = confidence_scorer.calculate_comprehensive_confidence(result['candidates'][0])
+            confidence_summary = confidence_scorer.get_confidence_summary(confidence_metrics)
+            print(f"   Candidate confidence: {confidence_summary.get('overall_confidence', 0):.2f}/1.0")
+        
+        print("\n4️⃣ Testing caching...")
+        cache_stats = cache.get_cache_stats()
+        print(f"   Cache stats: {cache_stats.get('total_entries', 0)} entries")
+        
+        print("\n5️⃣ Testing batch processing...")
+        jobs = create_sample_jobs()[:2]  # Just 2 jobs for demo
+        batch_processor = BatchProcessor(max_workers=2)
+        batch_processor.start_workers()
+        
+        try:
+            for job in jobs:
+                batch_processor.submit_job(job)
+            
+            batch_processor.wait_for_completion()
+            batch_results = batch_processor.get_all_results()
+            print(f"   Batch processed {len(batch_results)} jobs")
+        finally:
+            batch_processor.shutdown()
+        
+        print("\n✅ Demo completed successfully!")
 
 def print_enhanced_summary(result, job_info):
     """Print enhanced results summary"""
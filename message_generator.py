@@ -1,4 +1,6 @@
+import functools
 import json
+import re
 import requests
 from config import Config
 
@@ -6,6 +8,8 @@ class MessageGenerator:
     def __init__(self):
         self.api_key = Config.OPENROUTER_API_KEY
         self.model = Config.OPENROUTER_MODEL
+        # Keep-alive session: reuse one TLS connection across all messages
+        self.session = requests.Session()
     
     def generate_outreach_messages(self, candidates, job_description, max_messages=5):
         """
@@ -56,7 +60,7 @@ class MessageGenerator:
             "max_tokens": 300
         }
         
-        response = requests.post(
+        response = self.session.post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers=headers,
             json=data,
@@ -202,7 +206,9 @@ Best regards"""
         first_name = clean_name.split()[0] if clean_name.split() else "there"
         return first_name.strip()
     
-    def _extract_job_title(self, job_description):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _extract_job_title(job_description):
         """
         Extract job title from job description
         """
@@ -221,7 +227,9 @@ Best regards"""
         
         return "Software Engineer"
     
-    def _extract_company_name(self, job_description):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _extract_company_name(job_description):
         """
         Extract company name from job description
         """
@@ -234,7 +242,6 @@ Best regards"""
             r'work\s+at\s+([A-Z][A-Za-z\s&]+?)'
         ]
         
-        import re
         for pattern in patterns:
             match = re.search(pattern, job_description, re.IGNORECASE)
             if match:
@@ -258,7 +265,6 @@ Best regards"""
             r'([^•\n]+) \|'
         ]
         
-        import re
         for pattern in role_patterns:
             match = re.search(pattern, headline)
             if match:
@@ -5,11 +5,14 @@ Enhances LinkedIn data with GitHub, Twitter, and personal website information
 """
 
 import requests
+import random
 import re
+import threading
 import time
 import json
 from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup, Tag
+from urllib3.util.retry import Retry
 import logging
 from typing import Dict, List, Optional, Tuple
 from smart_cache import SmartCache
@@ -18,6 +21,57 @@ from smart_cache import SmartCache
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One keep-alive session shared by every collector (one per agent), so
+# concurrent workers reuse warm connections instead of each opening its own
+_POOL_SIZE = 100
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+class _FullJitterRetry(Retry):
+    """
+    Retry that sleeps a random time between 0 and the exponential backoff
+    delay ("full jitter"), so concurrent workers don't retry in lockstep.
+    A server's Retry-After is honoured only up to MAX_RETRY_AFTER seconds,
+    so one slow host can't stall an enrichment worker for hours
+    """
+    
+    MAX_RETRY_AFTER = 30
+    
+    def get_backoff_time(self):
+        return random.uniform(0, super().get_backoff_time())
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.MAX_RETRY_AFTER)
+
+# Transient failures (connection errors, timeouts, 429 and 5xx) are retried
+# with backoff before the collectors see them; 429s honour a capped Retry-After
+_RETRY = _FullJitterRetry(
+    total=4,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+def _get_shared_session() -> requests.Session:
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=_RETRY
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            })
+            _shared_session = session
+        return _shared_session
+
 class MultiSourceCollector:
     """
     Collects candidate information from multiple sources:
@@ -27,11 +81,9 @@ class MultiSourceCollector:
     - Personal websites
     """
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+    def __init__(self, session: Optional[requests.Session] = None):
+        # Defaults to the process-wide pooled session
+        self.session = session or _get_shared_session()
         self.github_api_base = "https://api.github.com"
         self.twitter_api_base = "https://api.twitter.com/2"
         self.smart_cache = SmartCache()
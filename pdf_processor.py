@@ -1,4 +1,3 @@
-import PyPDF2
 import os
 import re
 from typing import Dict, Optional
@@ -14,6 +13,9 @@ class PDFProcessor:
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
+        # Only PDF input needs PyPDF2; .txt job descriptions skip loading it
+        import PyPDF2
+        
         try:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -1,71 +1,71 @@
 import re
+import sys
+from dataclasses import dataclass
+from typing import Tuple
+import numpy as np
 from config import Config
 
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Skills looked for in job descriptions, in reporting order
+JOB_TECH_SKILLS = (
+    'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
+    'machine learning', 'ai', 'ml', 'data science', 'backend', 'frontend', 'full stack',
+    'sql', 'nosql', 'mongodb', 'postgresql', 'redis', 'elasticsearch', 'kafka',
+    'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'git', 'jenkins',
+    'terraform', 'ansible', 'microservices', 'api', 'rest', 'graphql'
+)
+# The core subset looked for in a candidate's headline and experience text
+CANDIDATE_TECH_SKILLS = JOB_TECH_SKILLS[:15]
+
+@dataclass(**_DATACLASS_OPTIONS)
+class JobFeatures:
+    """Job description preprocessed once for scoring many candidates"""
+    description: str
+    description_lower: str
+    keywords: Tuple[str, ...]
+
 class CandidateScorer:
+    # Weighted components of the fit score; the confidence bonus is added on top
+    COMPONENTS = ('education', 'trajectory', 'company', 'skills', 'location', 'tenure')
+    COMPONENT_WEIGHTS = (0.15, 0.20, 0.20, 0.25, 0.10, 0.10)
+    
     def __init__(self):
         self.weights = Config.SCORING_WEIGHTS
-        self.elite_schools = Config.ELITE_SCHOOLS
-        self.top_tech_companies = Config.TOP_TECH_COMPANIES
+        self.elite_schools = Config.ELITE_SCHOOLS_NORMALIZED
+        self.top_tech_companies = Config.TOP_TECH_COMPANIES_NORMALIZED
     
-    def score_candidates(self, candidates, job_description):
+    def preprocess_job(self, job_description):
+        """
+        Everything the scorer derives from the job description alone
         """
-        Score candidates based on job requirements and multi-source data
+        return JobFeatures(
+            description=job_description,
+            description_lower=job_description.lower(),
+            keywords=tuple(self._extract_job_keywords(job_description))
+        )
+    
+    def score_candidates(self, candidates, job):
         """
-        job_keywords = self._extract_job_keywords(job_description)
+        Score candidates based on job requirements and multi-source data.
+        `job` is a job description or its preprocess_job() features.
+        """
+        if isinstance(job, str):
+            job = self.preprocess_job(job)
+        breakdowns = [self._score_components(candidate, job) for candidate in candidates]
+        
+        # Weighted totals for all candidates at once
+        component_scores = np.array(
+            [[breakdown[component] for component in self.COMPONENTS] for breakdown in breakdowns],
+            dtype=np.float64
+        ).reshape(len(breakdowns), len(self.COMPONENTS))
+        confidence_bonus = np.array([breakdown['confidence_bonus'] for breakdown in breakdowns], dtype=np.float64)
+        total_scores = self.combine_scores(component_scores, confidence_bonus)
         
         scored_candidates = []
-        for candidate in candidates:
-            score_breakdown = {}
-            
-            # Education scoring (enhanced with multi-source data)
-            education_score = self._score_education(candidate, job_keywords)
-            score_breakdown['education'] = education_score
-            
-            # Career trajectory scoring
-            trajectory_score = self._score_career_trajectory(candidate, job_keywords)
-            score_breakdown['trajectory'] = trajectory_score
-            
-            # Company relevance scoring
-            company_score = self._score_company_relevance(candidate, job_keywords)
-            score_breakdown['company'] = company_score
-            
-            # Skills scoring (enhanced with GitHub and website data)
-            skills_score = self._score_skills_enhanced(candidate, job_keywords)
-            score_breakdown['skills'] = skills_score
-            
-            # Location scoring
-            location_score = self._score_location(candidate, job_description)
-            score_breakdown['location'] = location_score
-            
-            # Tenure scoring
-            tenure_score = self._score_tenure(candidate)
-            score_breakdown['tenure'] = tenure_score
-            
-            # Multi-source confidence bonus
-            confidence_bonus = self._calculate_confidence_bonus(candidate)
-            score_breakdown['confidence_bonus'] = confidence_bonus
-            
-            # Calculate weighted total score
-            weights = {
-                'education': 0.15,
-                'trajectory': 0.20,
-                'company': 0.20,
-                'skills': 0.25,
-                'location': 0.10,
-                'tenure': 0.10
-            }
-            
-            total_score = sum(score_breakdown[key] * weights[key] for key in weights.keys())
-            
-            # Add confidence bonus
-            total_score += confidence_bonus
-            
-            # Cap at 10.0
-            total_score = min(10.0, total_score)
-            
+        for candidate, score_breakdown, total_score in zip(candidates, breakdowns, total_scores.tolist()):
             candidate['fit_score'] = round(total_score, 1)
             candidate['score_breakdown'] = score_breakdown
-            
             scored_candidates.append(candidate)
         
         # Sort by fit score (highest first)
@@ -73,6 +73,67 @@ class CandidateScorer:
         
         return scored_candidates
     
+    def score_candidate(self, candidate, job):
+        """
+        Score a single candidate in place, exactly as score_candidates would.
+        Pass preprocess_job() features when scoring several for one job.
+        """
+        if isinstance(job, str):
+            job = self.preprocess_job(job)
+        score_breakdown = self._score_components(candidate, job)
+        # Six floats: a plain sum beats building arrays for combine_scores,
+        # and adds in the same order, so totals match the batch path
+        total_score = sum(
+            score_breakdown[component] * weight
+            for component, weight in zip(self.COMPONENTS, self.COMPONENT_WEIGHTS)
+        )
+        total_score = min(total_score + score_breakdown['confidence_bonus'], 10.0)
+        candidate['fit_score'] = round(total_score, 1)
+        candidate['score_breakdown'] = score_breakdown
+        return candidate
+    
+    def _score_components(self, candidate, job):
+        """
+        Component scores and confidence bonus for one candidate
+        """
+        job_keywords = job.keywords
+        score_breakdown = {}
+        
+        # Education scoring (enhanced with multi-source data)
+        score_breakdown['education'] = self._score_education(candidate, job_keywords)
+        
+        # Career trajectory scoring
+        score_breakdown['trajectory'] = self._score_career_trajectory(candidate, job_keywords)
+        
+        # Company relevance scoring
+        score_breakdown['company'] = self._score_company_relevance(candidate, job_keywords)
+        
+        # Skills scoring (enhanced with GitHub and website data)
+        score_breakdown['skills'] = self._score_skills_enhanced(candidate, job_keywords)
+        
+        # Location scoring
+        score_breakdown['location'] = self._score_location(candidate, job.description_lower)
+        
+        # Tenure scoring
+        score_breakdown['tenure'] = self._score_tenure(candidate)
+        
+        # Multi-source confidence bonus
+        score_breakdown['confidence_bonus'] = self._calculate_confidence_bonus(candidate)
+        
+        return score_breakdown
+    
+    def combine_scores(self, component_scores, confidence_bonus):
+        """
+        Fit scores from an (N, len(COMPONENTS)) score matrix and a length-N
+        confidence bonus: weighted sum plus bonus, capped at 10.0
+        """
+        total_scores = np.zeros(component_scores.shape[0])
+        # Column by column, so each total is summed in the same order as a scalar loop
+        for column, weight in enumerate(self.COMPONENT_WEIGHTS):
+            total_scores += component_scores[:, column] * weight
+        total_scores += confidence_bonus
+        return np.minimum(total_scores, 10.0)
+    
     def _calculate_score_breakdown(self, candidate, job_description):
         """
         Calculate individual component scores
@@ -101,7 +162,7 @@ class CandidateScorer:
                 degree = edu.get('degree', '').lower()
                 
                 # Check for elite schools
-                if any(elite in school_name for elite in [s.lower() for s in self.elite_schools]):
+                if any(elite in school_name for elite in self.elite_schools):
                     if 'phd' in degree or 'doctorate' in degree:
                         return 10.0
                     elif 'masters' in degree or 'mba' in degree:
@@ -176,14 +237,14 @@ class CandidateScorer:
         current_company = candidate.get('current_company', '').lower()
         
         # Check current company first
-        if any(company in current_company for company in [c.lower() for c in self.top_tech_companies]):
+        if any(company in current_company for company in self.top_tech_companies):
             return 9.0
         
         # Check all experience if available
         if experience and len(experience) > 0:
             for exp in experience:
                 company = exp.get('company', '').lower()
-                if any(top_company in company for top_company in [c.lower() for c in self.top_tech_companies]):
+                if any(top_company in company for top_company in self.top_tech_companies):
                     return 8.5
         
         # Check for relevant industry keywords
@@ -341,42 +402,15 @@ class CandidateScorer:
         """
         Extract relevant skills from job description
         """
-        skills = []
         job_desc_lower = job_description.lower()
-        
-        # Common tech skills
-        tech_skills = [
-            'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
-            'machine learning', 'ai', 'ml', 'data science', 'backend', 'frontend', 'full stack',
-            'sql', 'nosql', 'mongodb', 'postgresql', 'redis', 'elasticsearch', 'kafka',
-            'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'git', 'jenkins',
-            'terraform', 'ansible', 'microservices', 'api', 'rest', 'graphql'
-        ]
-        
-        for skill in tech_skills:
-            if skill in job_desc_lower:
-                skills.append(skill)
-        
-        return skills
+        return [skill for skill in JOB_TECH_SKILLS if skill in job_desc_lower]
     
     def _extract_skills_from_text(self, text):
         """
         Extract skills from text
         """
-        skills = []
         text_lower = text.lower()
-        
-        # Common tech skills
-        tech_skills = [
-            'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
-            'machine learning', 'ai', 'ml', 'data science', 'backend', 'frontend', 'full stack'
-        ]
-        
-        for skill in tech_skills:
-            if skill in text_lower:
-                skills.append(skill)
-        
-        return skills
+        return [skill for skill in CANDIDATE_TECH_SKILLS if skill in text_lower]
     
     def _extract_location_from_job_description(self, job_description):
         """
@@ -495,12 +529,11 @@ class CandidateScorer:
         score = min(10.0, (match_percentage * 8.0) + source_bonus)
         return round(score, 1)
     
-    def _score_location(self, candidate, job_description):
+    def _score_location(self, candidate, job_description_lower):
         """
         Score location relevance
         """
         candidate_location = candidate.get('location', '').lower()
-        job_description_lower = job_description.lower()
         
         if not candidate_location:
             return 5.0
@@ -532,4 +565,4 @@ class CandidateScorer:
         
         # Bonus up to 1.0 point for high confidence
         bonus = overall_confidence * 1.0
-        return round(bonus, 1) 
\ No newline at end of file
+        return round(bonus, 1)
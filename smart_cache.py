@@ -8,22 +8,49 @@ import json
 import hashlib
 import time
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import sqlite3
+import zlib
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Payloads are stored as compact JSON, zlib-compressed into a BLOB when
+# that is actually smaller; rows written as plain TEXT still read back fine
+_COMPRESS_THRESHOLD = 512  # characters
+_encode_json = json.JSONEncoder(separators=(',', ':')).encode
+
+def _serialize(data: Any):
+    text = _encode_json(data)
+    if len(text) < _COMPRESS_THRESHOLD:
+        return text
+    packed = zlib.compress(text.encode('utf-8'))
+    return packed if len(packed) < len(text) else text
+
+def _deserialize(stored) -> Any:
+    if isinstance(stored, bytes):
+        stored = zlib.decompress(stored)
+    return json.loads(stored)
+
 class SmartCache:
     """
     Intelligent caching system for LinkedIn sourcing data
     """
     
+    # In-process LRU in front of SQLite, holding stored (serialized) values
+    MEMORY_CACHE_SIZE = 4096
+    MEMORY_CACHE_TTL = 600  # seconds; never beyond the entry's own expiry
+    
     def __init__(self, cache_db_path="cache.db"):
         self.cache_db_path = cache_db_path
         self.init_cache_db()
         
+        self._memory = OrderedDict()  # cache key -> (monotonic deadline, stored value)
+        self._memory_lock = threading.Lock()
+        
         # Cache expiration times (in hours)
         self.expiration_times = {
             'linkedin_profile': 24,  # LinkedIn profiles change less frequently
@@ -31,8 +58,10 @@ class SmartCache:
             'github_repos': 6,       # Repositories change frequently
             'twitter_profile': 24,   # Twitter profiles are relatively static
             'website_data': 48,      # Personal websites change slowly
+            'enhanced_candidate': 12,  # Bounded by the fastest-changing source (GitHub)
             'search_results': 2,     # Search results change quickly
-            'job_analysis': 168      # Job analysis can be cached longer (1 week)
+            'job_analysis': 168,     # Job analysis can be cached longer (1 week)
+            'parsed_job': 168        # Keyed by file content, so only staleness is disk use
         }
     
     def init_cache_db(self):
@@ -86,16 +115,40 @@ class SmartCache:
         except:
             return True
     
+    def _memory_get(self, cache_key: str):
+        with self._memory_lock:
+            entry = self._memory.get(cache_key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._memory[cache_key]
+                return None
+            self._memory.move_to_end(cache_key)
+            return entry[1]
+    
+    def _memory_put(self, cache_key: str, stored, ttl: float):
+        with self._memory_lock:
+            self._memory[cache_key] = (time.monotonic() + min(ttl, self.MEMORY_CACHE_TTL), stored)
+            self._memory.move_to_end(cache_key)
+            if len(self._memory) > self.MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+    
     def get(self, data_type: str, identifier: str) -> Optional[Any]:
         """
         Get data from cache
         """
         try:
+            cache_key = self._generate_cache_key(data_type, identifier)
+            
+            # Values are kept serialized so every caller gets its own copy
+            stored = self._memory_get(cache_key)
+            if stored is not None:
+                logger.info(f"Cache HIT for {data_type}:{identifier}")
+                return _deserialize(stored)
+            
             conn = sqlite3.connect(self.cache_db_path)
             cursor = conn.cursor()
             
-            cache_key = self._generate_cache_key(data_type, identifier)
-            
             cursor.execute('''
                 SELECT data, expires_at FROM cache 
                 WHERE key = ? AND expires_at > ?
@@ -117,8 +170,11 @@ class SmartCache:
                 conn.commit()
                 conn.close()
                 
+                ttl = (datetime.fromisoformat(expires_at) - datetime.now()).total_seconds()
+                self._memory_put(cache_key, data, ttl)
+                
                 logger.info(f"Cache HIT for {data_type}:{identifier}")
-                return json.loads(data)
+                return _deserialize(data)
             else:
                 conn.close()
                 logger.info(f"Cache MISS for {data_type}:{identifier}")
@@ -143,13 +199,14 @@ class SmartCache:
             expires_at = datetime.now() + timedelta(hours=expiration_hours)
             
             # Store in cache
+            stored = _serialize(data)
             cursor.execute('''
                 INSERT OR REPLACE INTO cache 
                 (key, data, cache_type, created_at, expires_at, access_count, last_accessed)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (
                 cache_key,
-                json.dumps(data),
+                stored,
                 data_type,
                 datetime.now().isoformat(),
                 expires_at.isoformat(),
@@ -159,6 +216,7 @@ class SmartCache:
             
             conn.commit()
             conn.close()
+            self._memory_put(cache_key, stored, expiration_hours * 3600)
             
             logger.info(f"Cached {data_type}:{identifier} (expires in {expiration_hours}h)")
             
@@ -174,6 +232,8 @@ class SmartCache:
             cursor = conn.cursor()
             
             cache_key = self._generate_cache_key(data_type, identifier)
+            with self._memory_lock:
+                self._memory.pop(cache_key, None)
             
             cursor.execute('DELETE FROM cache WHERE key = ?', (cache_key,))
             
@@ -291,6 +351,18 @@ class SmartCache:
         """
         self.set('website_data', website_url, website_data)
     
+    def get_cached_enhanced_candidate(self, linkedin_url: str, content_hash: str) -> Optional[Dict]:
+        """
+        Get a multi-source enhanced candidate, keyed by the hash of its input
+        """
+        return self.get('enhanced_candidate', f"{linkedin_url}:{content_hash}")
+    
+    def cache_enhanced_candidate(self, linkedin_url: str, content_hash: str, candidate: Dict):
+        """
+        Cache a multi-source enhanced candidate
+        """
+        self.set('enhanced_candidate', f"{linkedin_url}:{content_hash}", candidate)
+    
     def get_cached_search_results(self, search_query: str) -> Optional[List[Dict]]:
         """
         Get cached search results
@@ -316,6 +388,18 @@ class SmartCache:
         """
         self.set('job_analysis', job_description, analysis)
     
+    def get_cached_parsed_job(self, file_hash: str) -> Optional[Dict]:
+        """
+        Get job information parsed from a job description file
+        """
+        return self.get('parsed_job', file_hash)
+    
+    def cache_parsed_job(self, file_hash: str, job_info: Dict):
+        """
+        Cache job information parsed from a job description file
+        """
+        self.set('parsed_job', file_hash, job_info)
+    
     def invalidate_linkedin_profile(self, linkedin_url: str):
         """
         Invalidate LinkedIn profile cache
@@ -350,6 +434,9 @@ class SmartCache:
             deleted_count = cursor.rowcount
             conn.commit()
             conn.close()
+            # Entries can go before they expire here, so drop the memory copies
+            with self._memory_lock:
+                self._memory.clear()
             
             logger.info(f"Cleaned up {deleted_count} cache entries older than {days_old} days")
             return deleted_count
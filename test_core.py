@@ -204,6 +204,206 @@ def test_output_format():
         print(f"❌ Output format test failed: {e}")
         return False
 
+def test_lock_free_queue():
+    """Test the batch processor's lock-free job queue"""
+    print("🧪 Testing lock-free queue...")
+    
+    try:
+        from queue import Empty, Full
+        from batch_processor import LockFreeQueue, LockFreeStack, PriorityJobQueue, ResultRing, JobRequest
+        
+        queue = LockFreeQueue(maxsize=2)
+        queue.put("job-1")
+        queue.put("job-2")
+        
+        # Bounded put times out when full
+        try:
+            queue.put("job-3", timeout=0.01)
+            assert False, "put should time out on a full queue"
+        except Full:
+            pass
+        
+        # FIFO order is preserved
+        assert queue.get(timeout=0.01) == "job-1"
+        assert queue.get(timeout=0.01) == "job-2"
+        
+        # Empty get times out
+        try:
+            queue.get(timeout=0.01)
+            assert False, "get should time out on an empty queue"
+        except Empty:
+            pass
+        
+        # join waits for task_done on every item
+        assert not queue.join(timeout=0.01)
+        queue.task_done()
+        queue.task_done()
+        assert queue.join(timeout=0.01)
+        
+        # A blocked get wakes when another thread puts an item
+        import threading
+        threading.Timer(0.05, queue.put, args=("job-late",)).start()
+        assert queue.get(timeout=5) == "job-late"
+        threading.Timer(0.05, queue.task_done).start()
+        assert queue.join(timeout=5)
+        
+        # Agent stack hands out the most recently returned item first
+        stack = LockFreeStack()
+        stack.push("agent-1")
+        stack.push("agent-2")
+        assert stack.pop() == "agent-2"
+        assert stack.pop() == "agent-1"
+        try:
+            stack.pop(timeout=0.01)
+            assert False, "pop should time out on an empty stack"
+        except Empty:
+            pass
+        
+        # Job queues serve higher priority first, FIFO within a priority
+        jobs = PriorityJobQueue()
+        jobs.put(JobRequest(job_id="low", job_description="", priority=1))
+        jobs.put(JobRequest(job_id="high", job_description="", priority=3))
+        jobs.put(JobRequest(job_id="low-2", job_description="", priority=1))
+        assert [jobs.get().job_id for _ in range(3)] == ["high", "low", "low-2"]
+        
+        # Results drain in one batched call
+        ring = ResultRing()
+        for i in range(5):
+            ring.push_nonblocking(i)
+        assert ring.get_many(3) == [0, 1, 2]
+        assert ring.get_many(10) == [3, 4]
+        assert ring.get_many(10, timeout=0.01) == []
+        
+        print("✅ Lock-free queue test passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Lock-free queue test failed: {e}")
+        return False
+
+def test_confidence_batch():
+    """Test that batch confidence scoring matches per-candidate scoring"""
+    print("🧪 Testing batch confidence scoring...")
+    
+    try:
+        from confidence_scorer import ConfidenceScorer
+        
+        scorer = ConfidenceScorer()
+        candidates = [
+            {
+                'name': 'Jane Doe',
+                'headline': 'Senior Engineer',
+                'skills': ['Python', 'Go'],
+                'github_profile': {'bio': 'Builder', 'public_repos': 3, 'followers': 1},
+                'github_repos': [{'updated_at': '', 'stars': 2}],
+                'personal_website': {'title': 'Jane - Portfolio', 'contact_info': {'email': 'jane@example.com'}}
+            },
+            {'name': 'John Smith', 'twitter_profile': {'username': 'jsmith'}},
+            {}
+        ]
+        
+        batch = scorer.calculate_batch(candidates)
+        assert len(batch) == len(candidates)
+        for i, candidate in enumerate(candidates):
+            metrics = scorer.calculate_comprehensive_confidence(candidate)
+            row = batch[i]
+            for field in batch.COLUMNS:
+                assert abs(getattr(row, field) - getattr(metrics, field)) < 1e-9, field
+            assert batch['overall'][i] == row.overall
+        
+        print("✅ Batch confidence scoring test passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Batch confidence scoring test failed: {e}")
+        return False
+
+def test_page_regex_linear():
+    """Test that page-source regexes stay fast on long runs of letters"""
+    print("🧪 Testing page-source regex backtracking...")
+    
+    try:
+        import time
+        import linkedin_searcher
+        
+        # An unbounded [A-Za-z\s&]+ takes tens of seconds on this input
+        page_text = 'A' * 20000
+        patterns = (
+            linkedin_searcher._FALLBACK_EDUCATION_PATTERNS +
+            linkedin_searcher._FALLBACK_EXPERIENCE_PATTERNS
+        )
+        start = time.perf_counter()
+        for pattern in patterns:
+            linkedin_searcher._first_matches(pattern, page_text, 3)
+        elapsed = time.perf_counter() - start
+        assert elapsed < 2.0, f"{elapsed:.2f}s"
+        
+        print("✅ Page-source regex backtracking test passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Page-source regex backtracking test failed: {e}")
+        return False
+
+def test_browser_pool():
+    """Test that the browser pool drops dead drivers and stops after close"""
+    print("🧪 Testing browser pool...")
+    
+    try:
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        from linkedin_searcher import BrowserPool
+        
+        class FakeDriver:
+            def __init__(self):
+                self.dead = False
+                self.quit_calls = 0
+            
+            @property
+            def current_window_handle(self):
+                if self.dead:
+                    raise WebDriverException("chrome not reachable")
+                return "window"
+            
+            def quit(self):
+                self.quit_calls += 1
+        
+        started = []
+        pool = BrowserPool(1, factory=lambda: started.append(FakeDriver()) or started[-1])
+        
+        # A timeout leaves a live browser, which goes back into the pool
+        try:
+            with pool.acquire() as driver:
+                raise TimeoutException("slow page")
+        except TimeoutException:
+            pass
+        with pool.acquire() as driver:
+            assert driver is started[0]
+        
+        # A crashed browser is quit and replaced, never handed out again
+        try:
+            with pool.acquire() as driver:
+                driver.dead = True
+                raise WebDriverException("chrome not reachable")
+        except WebDriverException:
+            pass
+        assert started[0].quit_calls == 1
+        with pool.acquire() as driver:
+            assert driver is started[1]
+        
+        # Closing quits checked-out drivers instead of re-queuing them
+        with pool.acquire() as driver:
+            pool.close()
+        with pool.acquire() as driver:
+            assert driver is None
+        assert len(started) == 2
+        
+        print("✅ Browser pool test passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Browser pool test failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("🚀 LinkedIn Sourcing Agent - Core Functionality Test")
@@ -215,6 +415,10 @@ def main():
         test_configuration,
         test_database,
         test_output_format,
+        test_lock_free_queue,
+        test_confidence_batch,
+        test_page_regex_linear,
+        test_browser_pool,
         test_basic_functionality
     ]
     